@@ -0,0 +1,7 @@
+"""
+Benchmarks for mplcursors, in the format of airspeed velocity (asv).
+
+Run e.g. ``asv run`` (or ``asv dev`` to quickly run them once against the
+current checkout, or ``asv continuous master HEAD`` to compare two commits)
+from the repository root; results are stored as JSON in ``.asv/results``.
+"""
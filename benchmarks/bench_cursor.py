@@ -0,0 +1,92 @@
+"""Timing of full `Cursor` event handling."""
+
+import mplcursors
+import numpy as np
+
+from .common import make_axes, make_event, process_event
+
+
+def _make_line(n):
+    ax = make_axes()
+    x = np.linspace(0, 1, n)
+    ax.plot(x, np.sin(2 * np.pi * x), "o-")
+    ax.figure.canvas.draw()
+    return ax
+
+
+class Hover:
+    params = ([10 ** 3, 10 ** 5, 10 ** 6], [1, 2])
+    param_names = ["n", "hover"]
+
+    def setup(self, n, hover):
+        ax = _make_line(n)
+        self.cursor = mplcursors.cursor(ax, hover=hover)
+        # Alternate between two points on the line, and one away from it.
+        self.events = [
+            make_event("motion_notify_event", ax, (x, np.sin(2 * np.pi * x)))
+            for x in [.2, .3]] + [
+            make_event("motion_notify_event", ax, (.5, 1))]
+
+    def time_hover(self, n, hover):
+        for event in self.events:
+            process_event(event)
+
+
+class AddSelection:
+    params = ([10 ** 3, 10 ** 6], [False, True])
+    param_names = ["n", "highlight"]
+
+    def setup(self, n, highlight):
+        ax = _make_line(n)
+        self.cursor = mplcursors.cursor(ax, highlight=highlight)
+        process_event(
+            make_event("button_press_event", ax, (.25, 1), 1))
+        self.pi = self.cursor.selections[0]
+
+    def time_add_selection(self, n, highlight):
+        self.cursor.add_selection(self.pi)
+
+
+class Move:
+    params = [10 ** 3, 10 ** 6]
+    param_names = ["n"]
+
+    def setup(self, n):
+        ax = _make_line(n)
+        self.cursor = mplcursors.cursor(ax)
+        process_event(
+            make_event("button_press_event", ax, (.25, 1), 1))
+        self.events = [
+            make_event("key_press_event", ax, (0, 0), key)
+            for key in ["shift+right", "shift+left"]]
+
+    def time_move(self, n):
+        for event in self.events:
+            process_event(event)
+
+
+class HoverManyAxes:
+    # Hovering over one of many subplots (each with a twin), but away from the
+    # data, to measure the per-axes overhead of event handling.
+    params = [1, 16, 64]
+    param_names = ["n_axes"]
+
+    def setup(self, n_axes):
+        fig = make_axes().figure
+        fig.clf()
+        n_rows = int(np.ceil(np.sqrt(n_axes)))
+        x = np.linspace(0, 1, 100)
+        for i in range(n_axes):
+            ax = fig.add_subplot(n_rows, n_rows, i + 1)
+            ax.plot(x, np.sin(2 * np.pi * x))
+            ax.twinx().plot(x, np.cos(2 * np.pi * x))
+        fig.canvas.draw()
+        self.cursor = mplcursors.cursor(fig, hover=True)
+        ax = fig.axes[0]
+        self.events = [
+            make_event("motion_notify_event", ax, (x, 1.05))
+            for x in [.4, .5, .6]]
+
+    def time_hover(self, n_axes):
+        for event in self.events:
+            process_event(event)
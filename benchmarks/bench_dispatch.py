@@ -0,0 +1,45 @@
+"""
+Overhead of the `Selection`-unpacking single-dispatch functions.
+
+``time_*_unpacked`` go through the fast path taken by ``f(*sel)`` calls;
+``time_*_keywords`` force the signature-binding path, i.e. the cost that all
+calls paid before the fast path was added.
+"""
+
+from matplotlib.figure import Figure
+import mplcursors
+from mplcursors import _pick_info
+import numpy as np
+
+
+class CallWithSelection:
+    def setup(self):
+        self.fig = Figure()
+        ax = self.fig.add_subplot()
+        line, = ax.plot(np.arange(10))
+        target = _pick_info.AttrArray([.5, .5])
+        target.index = .5
+        self.sel = mplcursors.Selection(line, target, 0, None, [])
+        self.kwargs = self.sel._asdict()
+        # Only measure the dispatch overhead, not the text formatting.
+        self.noop = _pick_info._call_with_selection(lambda sel: sel)
+        self.noop_key = _pick_info._call_with_selection(
+            lambda sel, *, key: sel)
+
+    def time_noop_unpacked(self):
+        self.noop(*self.sel)
+
+    def time_noop_keywords(self):
+        self.noop(**self.kwargs)
+
+    def time_noop_kwonly_unpacked(self):
+        self.noop_key(*self.sel, key="left")
+
+    def time_noop_kwonly_keywords(self):
+        self.noop_key(**self.kwargs, key="left")
+
+    def time_get_ann_text_unpacked(self):
+        mplcursors.get_ann_text(*self.sel)
+
+    def time_move_unpacked(self):
+        _pick_info.move(*self.sel, key="right")
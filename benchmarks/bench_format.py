@@ -0,0 +1,48 @@
+"""
+Coordinate formatting of annotation texts, on linear, date, and categorical
+axes.
+
+``time_format_cold`` formats a point with an empty cache (the cost paid on the
+first hover over each point); ``time_format_warm`` formats it again; and
+``time_format_bulk`` formats the 1000 points of the line at once, as done when
+exporting hover tables.
+"""
+
+import datetime
+
+from matplotlib import dates as mdates
+from mplcursors import _pick_info
+import numpy as np
+
+from .common import make_axes
+
+
+class FormatCoord:
+    params = ["linear", "date", "categorical"]
+    param_names = ["kind"]
+
+    def setup(self, kind):
+        self.ax = ax = make_axes()
+        n = 1000
+        if kind == "linear":
+            x = np.linspace(0, 1, n)
+        elif kind == "date":
+            x = mdates.drange(datetime.datetime(2014, 1, 15),
+                              datetime.datetime(2014, 3, 1),
+                              datetime.timedelta(hours=1))[:n]
+        elif kind == "categorical":
+            x = [f"c{i}" for i in range(n)]
+        line, = ax.plot(x, np.sin(np.arange(n)))
+        ax.figure.canvas.draw()
+        self.xys = line.get_xydata()
+        self.xy = self.xys[n // 2]
+
+    def time_format_cold(self, kind):
+        _pick_info._coord_text_caches.clear()
+        _pick_info._format_coord_unspaced(self.ax, self.xy)
+
+    def time_format_warm(self, kind):
+        _pick_info._format_coord_unspaced(self.ax, self.xy)
+
+    def time_format_bulk(self, kind):
+        _pick_info._format_coords_unspaced(self.ax, self.xys)
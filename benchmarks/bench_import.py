@@ -0,0 +1,10 @@
+"""Timing of ``import mplcursors``, in a fresh interpreter."""
+
+
+class Import:
+    def timeraw_import_mplcursors(self):
+        return "import mplcursors"
+
+    def timeraw_import_mplcursors_after_matplotlib(self):
+        # Typical for scripts, where Matplotlib's own import time dominates.
+        return "import mplcursors", "import matplotlib.pyplot"
@@ -0,0 +1,139 @@
+"""
+Memory usage of long-running hover/select/deselect sessions.
+
+The ``track_*`` benchmarks report, in bytes, the peak memory traced by
+`tracemalloc` while repeatedly selecting and deselecting points, and the
+memory still retained afterwards (relative to the state after a warmup cycle,
+so that one-time caches are not counted).
+
+Running this module as a script prints the allocation sites in mplcursors
+responsible for the retained memory::
+
+    $ python -m benchmarks.bench_memory [n_cycles]
+"""
+
+import fnmatch
+import gc
+import sys
+import tracemalloc
+
+import mplcursors
+import numpy as np
+
+from .common import make_axes, make_event, process_event
+
+
+_N_CYCLES = 200
+_FILENAME_PATTERNS = ["*/mplcursors/_pick_info.py",
+                      "*/mplcursors/_mplcursors.py"]
+
+
+def _make_session(kind, n):
+    """
+    Create an artist of size *n* and return a function running one
+    select/deselect cycle on it.
+    """
+    ax = make_axes()
+    x = np.linspace(0, 1, n)
+    y = np.sin(2 * np.pi * x)
+    if kind == "hover":
+        ax.plot(x, y, "o-")
+        cursor = mplcursors.cursor(ax, hover=True)
+    elif kind == "highlight":
+        ax.plot(x, y, "o-")
+        cursor = mplcursors.cursor(ax, highlight=True)
+    elif kind == "colormapped scatter":
+        # Exercises `_format_scalarmappable_value`.
+        ax.scatter(x, y, c=y)
+        cursor = mplcursors.cursor(ax)
+    else:
+        raise ValueError(f"Unknown session kind {kind!r}")
+    ax.figure.canvas.draw()
+    xys = [(.2, np.sin(2 * np.pi * .2)), (.3, np.sin(2 * np.pi * .3))]
+    if kind == "hover":
+        events = [make_event("motion_notify_event", ax, xy)
+                  for xy in [*xys, (.5, 1.5)]]  # Last one is away from data.
+    else:
+        events = [make_event("button_press_event", ax, xy, 1) for xy in xys]
+
+    def cycle():
+        for event in events:
+            process_event(event)
+        cursor.clear()
+
+    cycle.cursor = cursor  # Keep the cursor alive.
+    return cycle
+
+
+def trace_memory(cycle, n_cycles):
+    """
+    Run *cycle* *n_cycles* times under `tracemalloc` (requires Python≥3.9).
+
+    Return the peak traced memory and the retained memory (both in bytes,
+    relative to the state after one warmup cycle), and a snapshot of the
+    retained allocations.
+    """
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    try:
+        cycle()  # Warmup, populating one-time caches.
+        gc.collect()
+        start = tracemalloc.take_snapshot()
+        baseline, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        for _ in range(n_cycles):
+            cycle()
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+        diff = tracemalloc.take_snapshot().compare_to(start, "lineno")
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+    return peak - baseline, current - baseline, diff
+
+
+def report(diff, limit=10, file=None):
+    """Print the top mplcursors allocation sites in a snapshot difference."""
+    filtered = [
+        stat for stat in diff
+        if any(fnmatch.fnmatch(
+            stat.traceback[0].filename.replace("\\", "/"), pattern)
+            for pattern in _FILENAME_PATTERNS)]
+    for stat in filtered[:limit]:
+        print(stat, file=file)
+
+
+class Session:
+    params = (["hover", "highlight", "colormapped scatter"],
+              [10 ** 3, 10 ** 5])
+    param_names = ["kind", "n"]
+    timeout = 600
+    unit = "bytes"
+
+    def setup_cache(self):
+        results = {}
+        for kind in self.params[0]:
+            for n in self.params[1]:
+                peak, retained, _ = trace_memory(
+                    _make_session(kind, n), _N_CYCLES)
+                results[kind, n] = peak, retained
+        return results
+
+    def track_peak(self, results, kind, n):
+        return results[kind, n][0]
+
+    def track_retained(self, results, kind, n):
+        return results[kind, n][1]
+
+
+if __name__ == "__main__":
+    n_cycles = int(sys.argv[1]) if len(sys.argv) > 1 else _N_CYCLES
+    for kind in Session.params[0]:
+        for n in Session.params[1]:
+            peak, retained, diff = trace_memory(
+                _make_session(kind, n), n_cycles)
+            print(f"{kind}, n={n}, {n_cycles} cycles: "
+                  f"peak={peak / 1024:.1f} KiB, "
+                  f"retained={retained / 1024:.1f} KiB")
+            report(diff)
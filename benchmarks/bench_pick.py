@@ -0,0 +1,128 @@
+"""Timing of `compute_pick` for each supported artist type."""
+
+import warnings
+
+from matplotlib.container import Container
+import mplcursors
+from mplcursors import _pick_info
+import numpy as np
+
+from .common import make_axes, make_event
+
+
+def _stem(ax, x, y):
+    with warnings.catch_warnings():  # use_line_collection API change.
+        warnings.simplefilter("ignore")
+        return ax.stem(x, y, use_line_collection=True)
+
+
+# Plotting function and maximum size (beyond which creating the artist is
+# unreasonably slow) for each artist type.
+PLOTTERS = {
+    "Line2D (line)": (lambda ax, x, y: ax.plot(x, y)[0], 10 ** 7),
+    "Line2D (markers)": (lambda ax, x, y: ax.plot(x, y, "o")[0], 10 ** 7),
+    "Line2D (steps)": (
+        lambda ax, x, y: ax.plot(x, y, drawstyle="steps-mid")[0], 10 ** 7),
+    "Polygon": (lambda ax, x, y: ax.fill(x, y)[0], 10 ** 7),
+    "PathCollection (scatter)": (lambda ax, x, y: ax.scatter(x, y), 10 ** 6),
+    "LineCollection": (lambda ax, x, y: ax.vlines(x, 0, y), 10 ** 5),
+    "AxesImage": (
+        lambda ax, x, y: ax.imshow(
+            np.outer(y[:int(len(y) ** .5)], y[:int(len(y) ** .5)]),
+            extent=(0, 1, -1, 1), aspect="auto"),
+        10 ** 7),
+    "Quiver": (lambda ax, x, y: ax.quiver(x, y, 1, 1), 10 ** 6),
+    "BarContainer": (lambda ax, x, y: ax.bar(x, y, 1 / len(x)), 10 ** 4),
+    "ErrorbarContainer": (
+        lambda ax, x, y: ax.errorbar(x, y, .1, .1 / len(x)), 10 ** 5),
+    "StemContainer": (_stem, 10 ** 6),
+}
+
+
+class ComputePick:
+    params = ([*PLOTTERS], [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7])
+    param_names = ["artist", "n"]
+    timeout = 600
+
+    def setup(self, kind, n):
+        plotter, max_n = PLOTTERS[kind]
+        if n > max_n:
+            raise NotImplementedError  # Skip.
+        ax = make_axes()
+        x = np.linspace(0, 1, n)
+        y = np.sin(2 * np.pi * x)
+        artist = plotter(ax, x, y)
+        if isinstance(artist, Container):
+            artist = _pick_info.ContainerArtist(artist)
+        self.artist = artist
+        # Close to, but not exactly on, the artist.
+        self.event = make_event("motion_notify_event", ax, (.4, .6))
+
+    def time_compute_pick(self, kind, n):
+        mplcursors.compute_pick(self.artist, self.event)
+
+
+class ComputePickScales:
+    # Lines under non-affine (log, polar) and affine (linear) transforms, with
+    # the view unchanged between events or panned before each event.
+    params = (["linear", "log", "polar"], [False, True],
+              [10 ** 4, 10 ** 5, 10 ** 6])
+    param_names = ["scale", "pan", "n"]
+
+    def setup(self, scale, pan, n):
+        ax = (make_axes(projection="polar") if scale == "polar"
+              else make_axes(xscale=scale, yscale=scale))
+        x = np.linspace(1, 2, n)
+        self.artist, = ax.plot(x, np.sin(2 * np.pi * x) + 2)
+        self.event = make_event("motion_notify_event", ax, (1.4, 2.6))
+        self.pan = pan
+        mplcursors.compute_pick(self.artist, self.event)  # Warm up caches.
+
+    def time_compute_pick(self, scale, pan, n):
+        if self.pan:
+            ax = self.artist.axes
+            ax.set_ylim(*ax.get_ylim())
+        mplcursors.compute_pick(self.artist, self.event)
+
+
+class ComputePicksSteps:
+    # Batched picking on a noisy step plot, with queries scattered both close
+    # to and far from the line.
+    params = ([10 ** 4, 10 ** 6], [10 ** 2, 10 ** 4])
+    param_names = ["n", "n_queries"]
+    timeout = 600
+
+    def setup(self, n, n_queries):
+        ax = make_axes()
+        rs = np.random.RandomState(0)
+        x = np.linspace(0, 1, n)
+        self.artist, = ax.plot(
+            x, np.sin(2 * np.pi * x) + rs.normal(0, .1, n),
+            drawstyle="steps-mid")
+        ax.viewLim  # Unstale viewLim.
+        self.xys = ax.transData.transform(np.column_stack(
+            [rs.uniform(0, 1, n_queries), rs.uniform(-1.5, 1.5, n_queries)]))
+        mplcursors.compute_picks(self.artist, self.xys[:1])  # Warm up caches.
+
+    def time_compute_picks(self, n, n_queries):
+        mplcursors.compute_picks(self.artist, self.xys)
+
+
+class ProjectOnPolyline:
+    # The projection kernel alone, with reused scratch buffers.
+    params = (["float64", "float32"], [10 ** 4, 10 ** 5, 10 ** 6])
+    param_names = ["dtype", "n"]
+
+    def setup(self, dtype, n):
+        x = np.linspace(0, 600, n)
+        self.vertices = np.column_stack(
+            [x, 300 + 200 * np.sin(x / 50)]).astype(dtype)
+        self.segments = _pick_info._get_segments(
+            self.vertices[:-1], self.vertices[1:])
+        self.scratch = _pick_info._ProjectionScratch()
+        self.xys = np.array([[240, 350]], float)
+        self.time_project_on_polyline(dtype, n)  # Allocate the scratch.
+
+    def time_project_on_polyline(self, dtype, n):
+        _pick_info._project_on_polyline(
+            self.vertices, self.xys, self.segments, self.scratch)
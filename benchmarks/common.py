@@ -0,0 +1,38 @@
+"""Helpers shared by the benchmarks."""
+
+from matplotlib.backend_bases import KeyEvent, MouseEvent
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+
+class _DeferringCanvasAgg(FigureCanvasAgg):
+    # GUI canvases defer `draw_idle` to the event loop; here it is deferred
+    # indefinitely, so that only the cursor's own work is timed (full redraws
+    # can still be timed by explicitly calling `draw`).
+    def draw_idle(self, *args, **kwargs):
+        pass
+
+
+def make_axes(**kwargs):
+    """Create an axes on an Agg canvas, passing *kwargs* to `add_subplot`."""
+    fig = Figure()
+    _DeferringCanvasAgg(fig)
+    return fig.add_subplot(**kwargs)
+
+
+def make_event(name, ax, xy, *args):
+    """Create a mouse or key event at data coordinates *xy* of *ax*."""
+    ax.viewLim  # Unstale viewLim.
+    x, y = ax.transData.transform(xy)
+    if name in ["button_press_event", "button_release_event",
+                "motion_notify_event"]:
+        return MouseEvent(name, ax.figure.canvas, x, y, *args)
+    elif name in ["key_press_event", "key_release_event"]:
+        return KeyEvent(name, ax.figure.canvas, *args, x, y)
+    else:
+        raise ValueError(f"Unknown event name {name!r}")
+
+
+def process_event(event):
+    """Dispatch *event* to the callbacks connected to its canvas."""
+    event.canvas.callbacks.process(event.name, event)
@@ -4,7 +4,7 @@ Extracting data and labels from a :class:`~pandas.DataFrame`
 
 :class:`~pandas.DataFrame`\\s can be used similarly to any other kind of input.
 Here, we generate a scatter plot using two columns and label the points using
-a third column.
+a third column, bound with `Cursor.bind_labels`.
 """
 
 from matplotlib import pyplot as plt
@@ -19,9 +19,8 @@ df = DataFrame(
      ("Diane", 168, 57)],
     columns=["name", "height", "weight"])
 
-df.plot.scatter("height", "weight")
-mplcursors.cursor().connect(
-    "add", lambda sel: sel.annotation.set_text(df["name"][sel.target.index]))
+ax = df.plot.scatter("height", "weight")
+mplcursors.cursor().bind_labels(ax.collections[0], df["name"])
 plt.show()
 
 # test: skip
@@ -4,9 +4,12 @@ except ImportError:
     __version__ = "(unknown version)"
 
 
-from ._mplcursors import Cursor, HoverMode, cursor
-from ._pick_info import Selection, compute_pick, get_ann_text, make_highlight
+from ._mplcursors import Cursor, CursorStats, HoverMode, LabelMode, cursor
+from ._pick_info import (
+    Picks, Selection, compute_pick, compute_picks, get_ann_text,
+    make_highlight)
 
 
-__all__ = ["Cursor", "HoverMode", "cursor", "Selection",
-           "compute_pick", "get_ann_text", "make_highlight"]
+__all__ = ["Cursor", "CursorStats", "HoverMode", "LabelMode", "cursor",
+           "Picks", "Selection", "compute_pick", "compute_picks",
+           "get_ann_text", "make_highlight"]
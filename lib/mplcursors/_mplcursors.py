@@ -1,15 +1,22 @@
+from collections import Counter, defaultdict, deque
 from collections.abc import Iterable
-from contextlib import suppress
+from contextlib import contextmanager, suppress
 import copy
 from enum import IntEnum
+import functools
 from functools import partial
+import json
+from numbers import Integral, Real
 import sys
+import time
 import weakref
 from weakref import WeakKeyDictionary
 
-from matplotlib.axes import Axes
+from matplotlib import cbook
+from matplotlib.artist import Artist
+from matplotlib.cbook import CallbackRegistry
 from matplotlib.container import Container
-from matplotlib.figure import Figure
+from matplotlib.transforms import IdentityTransform
 import numpy as np
 
 from . import _pick_info
@@ -66,6 +73,41 @@ class _MarkedStr(str):
     """A string subclass solely for marking purposes."""
 
 
+def _make_text_lazy(text, get_default):
+    """
+    Make the string of `Text` *text* lazy: it is computed by *get_default*
+    when first read, unless it has been set before.
+
+    Return a function that restores the normal behavior of *text*, computing
+    its string if it is still unset.
+    """
+    def restore():
+        # Return whether the laziness was still active.  (`set_text` may be
+        # called after the string has been computed, e.g. with
+        # ``text.set_text(text.get_text() + ...)``.)
+        if "get_text" not in vars(text):
+            return False
+        del text.get_text, text.set_text
+        return True
+
+    def get_text():
+        finalize()
+        return text.get_text()
+
+    def set_text(s):
+        restore()
+        text.set_text(s)
+
+    def finalize():
+        if restore():
+            text.set_text(get_default())
+
+    # Matplotlib always goes through these methods to access the string.
+    text.get_text = get_text
+    text.set_text = set_text
+    return finalize
+
+
 def _mouse_event_matches(event, spec):
     """
     Return whether a mouse event "matches" an event spec, which is either a
@@ -93,27 +135,554 @@ def _iter_axes_subartists(ax):
     yield from ax.texts
 
 
-def _is_alive(artist):
-    """Check whether *artist* is still present on its parent axes."""
+@functools.lru_cache(None)  # Only patch once.
+def _register_cla():
+    """
+    Patch `Axes.cla` and `Axes.clear` to bump a per-axes generation counter.
+
+    Removing an artist unsets its ``.axes``, but clearing the axes does not
+    (matplotlib/matplotlib#6982); comparing the generation of the axes with the
+    one recorded when the artist was registered allows checking in O(1)
+    whether the artist has been cleared since.  (Both methods are patched as
+    either may call the other, depending on the Matplotlib version.)
+
+    This is called when the first `Cursor` is created, so that importing
+    mplcursors does not import `matplotlib.axes`; earlier clearings are
+    irrelevant anyways.
+    """
+    from matplotlib.axes import Axes
+
+    def make_wrapper(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            _axes_generations[self] = _axes_generations.get(self, 0) + 1
+            return wrapper.__wrapped__(self, *args, **kwargs)
+        return wrapper
+
+    Axes.cla = make_wrapper(Axes.cla)
+    Axes.clear = make_wrapper(Axes.clear)
+
+
+_axes_generations = WeakKeyDictionary()
+
+
+@functools.lru_cache(None)  # Only patch once.
+def _register_add_hooks():
+    """
+    Patch the ``Axes.add_*`` methods to notify the listeners connected with
+    `_connect_artist_added`.
+
+    All plotting methods go through these methods (and `Axes.errorbar`) to add
+    artists and containers to an axes (texts are not tracked, as they are not
+    selectable anyways).  This is only called when the first listener is
+    connected; afterwards, adding an artist to an axes that is not listened to
+    costs two dict lookups.
+    """
+    from matplotlib.axes import Axes
+
+    def make_wrapper(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            rv = wrapper.__wrapped__(self, *args, **kwargs)
+            for parent in [self, self.figure]:
+                registry = _artist_added_registries.get(parent)
+                if registry is not None:
+                    registry.process("artist_added", rv)
+            return rv
+        return wrapper
+
+    # Some Matplotlib versions append the result of `errorbar` directly to
+    # `Axes.containers`; notifying twice is harmless.
+    for name in ["add_collection", "add_container", "add_image", "add_line",
+                 "add_patch", "errorbar"]:
+        setattr(Axes, name, make_wrapper(getattr(Axes, name)))
+
+
+_artist_added_registries = WeakKeyDictionary()  # Axes or Figure -> registry.
+
+
+def _connect_artist_added(parent, func):
+    r"""
+    Call *func* with each artist or container added to *parent* (an `Axes` or
+    a `Figure`) from now on, and return a callable that disconnects it.
+
+    As for all `CallbackRegistry`\s, bound methods are only weakly referenced.
+    """
+    _register_add_hooks()
+    registry = _artist_added_registries.setdefault(parent, CallbackRegistry())
+    return partial(registry.disconnect, registry.connect("artist_added", func))
+
+
+def _attach_on_first_artist(figure, **kwargs):
+    """
+    Create a `cursor` for *figure* (with *kwargs*) when an artist is first
+    added to it; later artists are registered as they are added.
+
+    This is used by the :envvar:`MPLCURSORS` hook, which calls it for each new
+    figure.  Figures that do not have a canvas manager when their first
+    artist is added (i.e., that are not managed by pyplot, such as figures
+    created internally for rendering or formatting) get no cursor.
+    """
+
+    def on_artist_added(artist):
+        disconnect()
+        if getattr(figure.canvas, "manager", None) is None:
+            return
+        cursor(figure, track=True, **kwargs)
+
+    disconnect = _connect_artist_added(figure, on_artist_added)
+
+
+def _get_generation(ax):
+    """Return the generation of *ax*, or None for figure-level artists."""
+    return _axes_generations.get(ax, 0) if ax else None
+
+
+def _is_alive(artist, generation):
+    """
+    Check whether *artist* is still present on its parent axes, given the
+    *generation* of the axes when the artist was registered.
+    """
     return bool(artist
                 and artist.axes
-                and (artist.container in artist.axes.containers
-                     if isinstance(artist, _pick_info.ContainerArtist) else
-                     artist in _iter_axes_subartists(artist.axes)))
+                and _get_generation(artist.axes) == generation
+                and (not isinstance(artist, _pick_info.ContainerArtist)
+                     or artist.container in artist.axes.containers))
+
+
+def _selection_key(sel):
+    """
+    Return a hashable key identifying the picked point of selection *sel*.
+
+    Targets are compared by value; artists by identity (containers, being
+    tuples, may be unhashable or expensive to hash).
+    """
+    return id(sel.artist), tuple(sel.target)
 
 
 def _reassigned_axes_event(event, ax):
     """Reassign *event* to *ax*."""
+    if event.inaxes is ax:  # Data coordinates are already correct.
+        return event
     event = copy.copy(event)
     event.xdata, event.ydata = (
-        ax.transData.inverted().transform((event.x, event.y)))
+        _pick_info._get_inverted_transform(ax.transData)
+        .transform((event.x, event.y)))
     return event
 
 
+class _Durations:
+    """
+    Bounded aggregate of durations: the exact count, total, and maximum, and
+    the most recent durations (for percentiles).
+    """
+
+    def __init__(self, max_samples):
+        self.count = 0
+        self.total = 0.
+        self.max = 0.
+        self.samples = deque(maxlen=max_samples)
+
+    def add(self, duration):
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+        self.samples.append(duration)
+
+
+class CursorStats:
+    """
+    Timing statistics of the various phases of a `Cursor`'s event handling.
+
+    Assign an instance to `Cursor.stats` to start collecting statistics.  The
+    recorded phases are
+
+    - ``"event"``: handling of a selection event, including all of the
+      following phases;
+    - ``"pick"``: `compute_pick` on one artist (keyed by the artist);
+    - ``"text"``: `get_ann_text`, or the lookup of bound labels (see
+      `Cursor.bind_labels`) (keyed by the artist);
+    - ``"position"``: automatic positioning of the annotation;
+    - ``"draw"``: redraw requests (`draw_idle` and blitting; note that
+      `draw_idle` typically defers the actual drawing);
+    - ``"add"`` and ``"remove"``: `Cursor.add_selection` and
+      `Cursor.remove_selection` (including the callbacks);
+    - ``"export"``: `Cursor.export_hover_table` on one artist (keyed by the
+      artist).
+
+    Artist keys are only weakly referenced: the statistics of an artist are
+    discarded when it is garbage collected.  Memory use is bounded for each
+    key, as only the *max_samples* most recent durations are kept (the
+    percentiles reported by `summary` are computed over them; the other
+    statistics are exact).
+
+    More generally, `Cursor.stats` can be set to any object with a ``record``
+    method with the same signature as `CursorStats.record`.
+    """
+
+    def __init__(self, max_samples=1000):
+        self._max_samples = max_samples
+        self._durations = {}  # (phase, key) -> _Durations.
+
+    def record(self, phase, key, duration):
+        """Record a *duration* (in seconds) for a *phase* and a *key*."""
+        try:
+            key = weakref.ref(key, self._on_key_collected)
+        except TypeError:  # E.g. None.
+            pass
+        try:
+            durations = self._durations[phase, key]
+        except KeyError:
+            durations = self._durations[phase, key] = _Durations(
+                self._max_samples)
+        durations.add(duration)
+
+    def _on_key_collected(self, ref):
+        for phase_key in [phase_key for phase_key in self._durations
+                          if phase_key[1] is ref]:
+            del self._durations[phase_key]
+
+    def _items(self):
+        """Yield ``(phase, key, durations)``, dereferencing artist keys."""
+        for (phase, key), durations in [*self._durations.items()]:
+            if isinstance(key, weakref.ref):
+                key = key()
+                if key is None:
+                    continue
+            yield phase, key, durations
+
+    def reset(self):
+        """Clear all recorded durations."""
+        self._durations.clear()
+
+    def summary(self, by_key=False):
+        """
+        Return a dict mapping each phase (or each ``(phase, key)`` pair, if
+        *by_key* is set) to a dict of statistics about its durations (count,
+        total, mean, median, 90th and 99th percentiles, and maximum; all in
+        seconds).
+        """
+        groups = defaultdict(list)
+        for phase, key, durations in self._items():
+            groups[(phase, key) if by_key else phase].append(durations)
+        summary = {}
+        for group, aggregates in groups.items():
+            count = sum(durations.count for durations in aggregates)
+            total = sum(durations.total for durations in aggregates)
+            p50, p90, p99 = np.percentile(
+                [sample for durations in aggregates
+                 for sample in durations.samples],
+                [50, 90, 99])
+            summary[group] = dict(
+                count=count, total=total, mean=total / count,
+                p50=p50, p90=p90, p99=p99,
+                max=max(durations.max for durations in aggregates))
+        return summary
+
+    def slowest(self, phase="pick", n=5):
+        """
+        Return the (up to) *n* keys (e.g. artists) of *phase* with the
+        highest total duration, as a list of ``(key, total)`` pairs.
+        """
+        totals = [(key, durations.total)
+                  for phase_, key, durations in self._items()
+                  if phase_ == phase]
+        return sorted(totals, key=lambda kv: kv[1], reverse=True)[:n]
+
+
+class _Timer:
+    """Context manager recording its duration into a `CursorStats`."""
+
+    def __init__(self, stats, phase, key):
+        self._stats = stats
+        self._phase = phase
+        self._key = key
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        self._stats.record(
+            self._phase, self._key, time.perf_counter() - self._start)
+
+
+_null_timer = suppress()  # Stateless, thus reusable.
+
+
+def _timed(phase):
+    """Decorator recording the duration of a `Cursor` method as *phase*."""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self._timer(phase):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
 class HoverMode(IntEnum):
     NoHover, Persistent, Transient = range(3)
 
 
+class LabelMode(IntEnum):
+    Annotation, Batched, Headless = range(3)
+
+
+class _LabelLayer(Artist):
+    """
+    An artist drawing the labels of many selections on an axes.
+
+    Each label is stored as a ``(target, text, position)`` triple (where
+    *position* is one of the cursor's annotation_positions); all labels are
+    drawn by successively reconfiguring a single template `Annotation`.
+    """
+
+    def __init__(self, axes, annotation_kwargs):
+        super().__init__()
+        self.set_zorder(np.inf)
+        from matplotlib.text import Annotation
+        self._labels = {}  # Selection id -> (target, text, position).
+        self._template = Annotation(
+            "", xy=(0, 0), xytext=(0, 0), **annotation_kwargs)
+        self._template.set_transform(IdentityTransform())
+        axes.add_artist(self)
+        self._template.axes = axes
+        self._template.set_figure(axes.figure)
+        # Window extents of the labels (in draw order) at the last draw.
+        self._drawn_ids = []
+        self._drawn_extents = np.empty((0, 4))
+
+    def __len__(self):
+        return len(self._labels)
+
+    def get_template(self, target, text):
+        """Return the template annotation, set up for *target* and *text*."""
+        self._template.xy = target
+        self._template.set_text(text)
+        return self._template
+
+    def add_label(self, sel_id, target, text, position):
+        self._labels[sel_id] = target, text, position
+        self.stale = True
+
+    def set_label_text(self, sel_id, text):
+        """Set the text of a label, if it is (still) present."""
+        label = self._labels.get(sel_id)
+        if label is None:
+            return
+        target, _, position = label
+        self._labels[sel_id] = target, text, position
+        self.stale = True
+
+    def pop_label(self, sel_id):
+        """Remove and return a label, or return None if it is not present."""
+        label = self._labels.pop(sel_id, None)
+        if label is not None:
+            self.stale = True
+        return label
+
+    def label_at(self, event):
+        """Return the id of the topmost label drawn under *event*, or None."""
+        x0, y0, x1, y1 = self._drawn_extents.T
+        hits, = np.nonzero(
+            (x0 <= event.x) & (event.x <= x1)
+            & (y0 <= event.y) & (event.y <= y1))
+        return next((self._drawn_ids[idx] for idx in hits[::-1]
+                     if self._drawn_ids[idx] in self._labels), None)
+
+    def draw(self, renderer):
+        ids = []
+        extents = []
+        if self.get_visible():
+            for sel_id, (target, text, position) in self._labels.items():
+                ann = self.get_template(target, text)
+                ann.set(**position)
+                ann.draw(renderer)
+                ids.append(sel_id)
+                extents.append(ann.get_window_extent(renderer).extents)
+        self._drawn_ids = ids
+        self._drawn_extents = np.reshape(extents, (-1, 4))
+        self.stale = False
+
+
+class _LabelBinding:
+    """
+    Label texts bound to an artist, either as an array of labels or as a
+    vectorized formatter; see `Cursor.bind_labels`.
+    """
+
+    def __init__(self, labels):
+        if callable(labels):
+            self._formatter = labels
+            self._labels = None
+        else:
+            self._formatter = None
+            self._labels = np.asarray(labels, object)
+        self._cache = {}  # Index -> text, for formatters.
+
+    def get_text(self, artist, index):
+        """
+        Return the label of the point at *index* in *artist*, or None if
+        *index* is None.
+        """
+        if index is None:
+            return None
+        key = self._get_key(index)
+        if self._formatter is None:
+            # Tuple keys (e.g. ``(segment, vertex)`` on a `LineCollection`)
+            # index as many dimensions as the labels have.
+            return str(self._labels[
+                key[:self._labels.ndim] if isinstance(key, tuple) else key])
+        if key not in self._cache and not self._cache:
+            # On first use, format the labels of all points at once.
+            hover_targets = _pick_info._get_hover_targets(artist)
+            if hover_targets is not None:
+                self._format([*map(self._get_key, hover_targets[0])])
+        if key not in self._cache:
+            self._format([key])
+        return self._cache[key]
+
+    @classmethod
+    def _get_key(cls, index):
+        """Normalize a ``target.index`` to an int or a tuple of ints."""
+        if isinstance(index, _pick_info.Index):  # On a step: use its start.
+            return index.int
+        elif isinstance(index, Integral):
+            return int(index)
+        elif isinstance(index, Real):
+            return int(round(index))  # Between two points: use the nearest.
+        else:  # E.g., a tuple, for collections and images.
+            return tuple(map(cls._get_key, np.atleast_1d(index)))
+
+    def _format(self, keys):
+        self._cache.update(zip(
+            keys, map(str, self._formatter(np.asarray(keys)))))
+
+
+class _DeferredCallback:
+    """
+    An ``"add"`` callback to be run on an executor; see `Cursor.connect`.
+
+    Compares equal to the wrapped callback, so that it can be disconnected
+    by passing the latter to `Cursor.disconnect`.
+    """
+
+    def __init__(self, func, executor):
+        self.func = func
+        self.executor = executor
+
+    def __eq__(self, other):
+        return self is other or self.func == other
+
+    __hash__ = object.__hash__
+
+
+class _SelectionStream:
+    """
+    Asynchronous iterator over the selections passed to a `Cursor` event; see
+    `Cursor.stream`.
+    """
+
+    def __init__(self, cursor, event, maxsize, overflow):
+        import asyncio
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be positive, not {maxsize}")
+        if overflow not in ["drop-oldest", "coalesce"]:
+            raise ValueError(f"Invalid overflow policy: {overflow!r}")
+        self._loop = asyncio.get_running_loop()
+        self._queue = deque()
+        self._maxsize = maxsize
+        self._overflow = overflow
+        self._waiter = None
+        self._closed = False
+        self._cursor = cursor
+        self._event = event
+        cursor.connect(event, self._push)
+        cursor._streams.add(self)
+
+    def _push(self, sel):
+        # Called from the GUI thread, which may not run the event loop; the
+        # selection is only queued (and the queue only modified) by the loop.
+        # If the loop has been closed, nobody can consume the stream anymore.
+        if self._loop.is_closed():
+            self._detach()
+            self._closed = True
+            return
+        self._loop.call_soon_threadsafe(self._enqueue, sel)
+
+    def _enqueue(self, sel):
+        if self._closed:
+            return
+        if len(self._queue) >= self._maxsize:
+            if self._overflow == "drop-oldest":
+                self._queue.popleft()
+            else:  # coalesce
+                self._queue.pop()
+        self._queue.append(sel)
+        self._wake()
+
+    def _wake(self):
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    async def __aiter__(self):
+        # An async generator, so that exiting an ``async for`` loop early
+        # (which finalizes the generator) also closes the stream.
+        try:
+            while True:
+                try:
+                    sel = await self.__anext__()
+                except StopAsyncIteration:
+                    return
+                yield sel
+        finally:
+            self.close()
+
+    async def __anext__(self):
+        while not self._queue:
+            if self._closed:
+                raise StopAsyncIteration
+            self._waiter = self._loop.create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+        return self._queue.popleft()
+
+    def close(self):
+        """
+        Disconnect the stream from the cursor; iteration stops once the
+        already queued selections have been consumed.
+        """
+        if not self._detach():
+            return
+        if self._loop.is_closed():
+            self._closed = True
+        else:
+            # Let the selections already pushed get queued first.
+            self._loop.call_soon_threadsafe(self._finish)
+
+    async def aclose(self):
+        """Close the stream (see `close`)."""
+        self.close()
+
+    def _detach(self):
+        """
+        Disconnect the stream from the cursor; return whether it was still
+        connected.
+        """
+        if self not in self._cursor._streams:
+            return False
+        self._cursor._streams.discard(self)
+        with suppress(ValueError):
+            self._cursor.disconnect(self._event, self._push)
+        return True
+
+    def _finish(self):
+        self._closed = True
+        self._wake()
+
+
 class Cursor:
     """
     A cursor for selecting Matplotlib artists.
@@ -128,6 +697,9 @@ class Cursor:
         See the *annotation_positions* keyword argument to the constructor.
     highlight_kwargs : dict
         See the *highlight_kwargs* keyword argument to the constructor.
+    stats : Optional[CursorStats]
+        If not None, the `CursorStats` (or similar object) where timings of
+        the event handling phases are recorded.  Defaults to None.
     """
 
     _keep_alive = WeakKeyDictionary()
@@ -141,7 +713,9 @@ class Cursor:
                  bindings=None,
                  annotation_kwargs=None,
                  annotation_positions=None,
-                 highlight_kwargs=None):
+                 highlight_kwargs=None,
+                 label_mode=LabelMode.Annotation,
+                 screen_dtype=np.float64):
         """
         Construct a cursor.
 
@@ -214,37 +788,96 @@ class Cursor:
 
         highlight_kwargs : dict, default: {}
             Keyword arguments used to create a highlighted artist.
+
+        label_mode : `LabelMode`, default: `LabelMode.Annotation`
+            How selections are labeled.  Possible values are
+
+            - `LabelMode.Annotation`: each `Selection` gets its own draggable
+              `~matplotlib.text.Annotation`.
+            - `LabelMode.Batched`: the labels of all selections on an axes are
+              drawn by a single artist, which is much cheaper when many
+              selections are displayed at once (with *multiple* set).  Such
+              selections have their :attr:`annotation` field set to None, and
+              their label cannot be customized by the ``"add"`` callbacks.
+              Clicking on a label (with the *select* binding) converts it to a
+              regular draggable annotation.
+            - `LabelMode.Headless`: no artist is created and nothing is drawn
+              (in particular, *highlight* is ignored); selections only trigger
+              the ``"add"`` and ``"remove"`` callbacks, with their
+              :attr:`annotation` field set to None, and the default annotation
+              text is displayed in the toolbar's message area, if there is a
+              toolbar.  This mode has the lowest latency per event.
+
+        screen_dtype : {float64, float32}, default: float64
+            The dtype of the screen coordinates of lines when projecting on
+            them (see `compute_picks`).  float32 halves the memory traffic of
+            picking long lines, at the cost of precision (by a small fraction
+            of a pixel).
         """
 
+        _register_cla()
+        _pick_info._register_pending()
+
         artists = [*artists]
-        # Be careful with GC.
-        self._artists = [weakref.ref(artist) for artist in artists]
+        # Be careful with GC (collected artists are dropped by
+        # `_on_artist_collected`).  Also record the generation of each
+        # artist's axes, to detect later clearings (see `_is_alive`).
+        self._artists = {
+            weakref.ref(artist, self._on_artist_collected):
+            _get_generation(artist.axes)
+            for artist in artists}
+        # Map containers (by id, as they may be unhashable) to their
+        # ContainerArtists.
+        self._container_artists = weakref.WeakValueDictionary(
+            (id(artist.container), artist) for artist in artists
+            if isinstance(artist, _pick_info.ContainerArtist))
 
         for artist in artists:
             type(self)._keep_alive.setdefault(artist, set()).add(self)
 
         self._multiple = multiple
         self._highlight = highlight
+        self._label_mode = label_mode
+        self._screen_dtype = _pick_info._check_screen_dtype(screen_dtype)
+        self._label_layers = WeakKeyDictionary()  # Axes -> _LabelLayer.
+        # Artists (or ContainerArtists) -> _LabelBinding.
+        self._label_bindings = WeakKeyDictionary()
 
         self._visible = True
         self._enabled = True
-        self._selections = []
+        # Selections are indexed by id (as they compare by identity), together
+        # with their key (see `_selection_key`); keys are also counted for
+        # duplicate detection.
+        self._selections = {}
+        self._selection_keys = Counter()
+        # Id of promoted selection -> original batched selection, whose id
+        # remains the index of the promoted one (see `_promote_label`).
+        self._promoted = {}
         self._last_auto_position = None
-        self._callbacks = {"add": [], "remove": []}
+        self._pending_canvases = None  # Set of canvases when batching draws.
+        self._callbacks = {"add": [], "remove": [], "view_change": []}
+        self._view_watched = WeakKeyDictionary()  # Axes/Figure -> True.
+        self._streams = set()
+        # Selection id -> futures of the deferred callbacks; results are
+        # applied by a timer (on the GUI thread).
+        self._deferred_futures = {}
+        self._deferred_results = deque()
+        self._deferred_timer = None
+        self.stats = None
 
         self._hover = hover
-        connect_pairs = [("key_press_event", self._on_key_press)]
+        self._connect_pairs = [("key_press_event", self._on_key_press)]
         if hover:
-            connect_pairs += [
+            self._connect_pairs += [
                 ("motion_notify_event", self._hover_handler),
                 ("button_press_event", self._hover_handler)]
         else:
-            connect_pairs += [
+            self._connect_pairs += [
                 ("button_press_event", self._nonhover_handler)]
-        self._disconnectors = [
-            partial(canvas.mpl_disconnect, canvas.mpl_connect(*pair))
-            for pair in connect_pairs
-            for canvas in {artist.figure.canvas for artist in artists}]
+        self._disconnectors = []
+        self._connected_canvases = set()
+        for artist in artists:
+            self._connect_canvas(artist.figure.canvas)
 
         bindings = {**_default_bindings,
                     **(bindings if bindings is not None else {})}
@@ -276,9 +909,22 @@ class Cursor:
     @property
     def artists(self):
         """The tuple of selectable artists."""
-        # Work around matplotlib/matplotlib#6982: `cla()` does not clear
-        # `.axes`.
-        return tuple(filter(_is_alive, (ref() for ref in self._artists)))
+        artists = []
+        cleared = []
+        for ref, generation in self._artists.items():
+            artist = ref()
+            if _is_alive(artist, generation):
+                artists.append(artist)
+            elif (artist is not None and artist.axes
+                  and _get_generation(artist.axes) != generation):
+                # The axes was cleared; the artist can never come back.
+                cleared.append(ref)
+        for ref in cleared:
+            del self._artists[ref]
+        return tuple(artists)
+
+    def _on_artist_collected(self, ref):
+        self._artists.pop(ref, None)
 
     @property
     def enabled(self):
@@ -292,11 +938,12 @@ class Cursor:
     @property
     def selections(self):
         r"""The tuple of current `Selection`\s."""
-        for sel in self._selections:
-            if sel.annotation.axes is None:
+        sels = tuple(sel for sel, _ in self._selections.values())
+        for sel in sels:
+            if sel.annotation is not None and sel.annotation.axes is None:
                 raise RuntimeError("Annotation unexpectedly removed; "
                                    "use 'cursor.remove_selection' instead")
-        return tuple(self._selections)
+        return sels
 
     @property
     def visible(self):
@@ -312,17 +959,65 @@ class Cursor:
     def visible(self, value):
         self._visible = value
         for sel in self.selections:
-            sel.annotation.set_visible(value)
-            sel.annotation.figure.canvas.draw_idle()
+            if sel.annotation is not None:
+                sel.annotation.set_visible(value)
+                sel.annotation.figure.canvas.draw_idle()
+        for layer in self._label_layers.values():
+            layer.set_visible(value)
+            layer.figure.canvas.draw_idle()
+
+    def _timer(self, phase, key=None):
+        """Return a context manager timing *phase*, if stats are enabled."""
+        return (_Timer(self.stats, phase, key) if self.stats is not None
+                else _null_timer)
+
+    def _connect_canvas(self, canvas):
+        """Connect the event handlers to *canvas*, if not done yet."""
+        if canvas in self._connected_canvases:
+            return
+        self._connected_canvases.add(canvas)
+        self._disconnectors.extend(
+            partial(canvas.mpl_disconnect, canvas.mpl_connect(*pair))
+            for pair in self._connect_pairs)
+
+    def _track(self, parent):
+        """
+        Make artists and containers later added to *parent* (an `Axes` or a
+        `Figure`) selectable, keeping the cursor alive as long as *parent*.
+        """
+        self._disconnectors.append(
+            _connect_artist_added(parent, self._on_artist_added))
+        type(self)._keep_alive.setdefault(parent, set()).add(self)
+
+    def _on_artist_added(self, aoc):
+        """Make artist-or-container *aoc* selectable, in O(1)."""
+        if isinstance(aoc, Container):
+            contained = [*filter(None, aoc.get_children())]
+            if not contained or self._get_container_artist(aoc):
+                return
+            # The contained artists were added (and thus registered) first;
+            # the container now supersedes them, as in `cursor`.
+            for artist in contained:
+                self._artists.pop(weakref.ref(artist), None)
+            artist = _pick_info.ContainerArtist(aoc)
+            self._container_artists[id(aoc)] = artist
+        else:
+            artist = aoc
+        self._artists[weakref.ref(artist, self._on_artist_collected)] = (
+            _get_generation(artist.axes))
+        type(self)._keep_alive.setdefault(artist, set()).add(self)
+        self._connect_canvas(artist.figure.canvas)
+
+    def _get_container_artist(self, container):
+        """Return the ContainerArtist wrapping *container*, or None."""
+        ca = self._container_artists.get(id(container))
+        return ca if ca is not None and ca.container is container else None
 
     def _get_figure(self, aoc):
         """Return the parent figure of artist-or-container *aoc*."""
         if isinstance(aoc, Container):
-            try:
-                ca, = {artist for artist in (ref() for ref in self._artists)
-                       if isinstance(artist, _pick_info.ContainerArtist)
-                          and artist.container is aoc}
-            except ValueError:
+            ca = self._get_container_artist(aoc)
+            if ca is None:
                 raise ValueError(f"Cannot find parent figure of {aoc}")
             return ca.figure
         else:
@@ -331,16 +1026,39 @@ class Cursor:
     def _get_axes(self, aoc):
         """Return the parent axes of artist-or-container *aoc*."""
         if isinstance(aoc, Container):
-            try:
-                ca, = {artist for artist in (ref() for ref in self._artists)
-                       if isinstance(artist, _pick_info.ContainerArtist)
-                          and artist.container is aoc}
-            except ValueError:
+            ca = self._get_container_artist(aoc)
+            if ca is None:
                 raise ValueError(f"Cannot find parent axes of {aoc}")
             return ca.axes
         else:
             return aoc.axes
 
+    @contextmanager
+    def _batched_draws(self):
+        """
+        Context manager within which redraws requested by `add_selection` and
+        `remove_selection` are coalesced into one `draw_idle` per canvas.
+        """
+        if self._pending_canvases is not None:  # Already batching.
+            yield
+            return
+        self._pending_canvases = set()
+        try:
+            yield
+        finally:
+            canvases, self._pending_canvases = self._pending_canvases, None
+            for canvas in canvases:
+                canvas.draw_idle()
+
+    @_timed("draw")
+    def _draw_idle(self, figure):
+        """Request a redraw of *figure*, possibly deferred by batching."""
+        if self._pending_canvases is not None:
+            self._pending_canvases.add(figure.canvas)
+        else:
+            figure.canvas.draw_idle()
+
+    @_timed("add")
     def add_selection(self, pi):
         """
         Create an annotation for a `Selection` and register it.
@@ -356,56 +1074,60 @@ class Cursor:
 
         Likewise, if the text alignment is not explicitly set but the position
         is, then a suitable alignment will be automatically computed.
+
+        The default annotation text (see `get_ann_text` and `bind_labels`) is
+        only computed if a callback reads it, or if no callback sets the text.
+
+        If the cursor's *label_mode* is `LabelMode.Batched`, no annotation is
+        created (the :attr:`annotation` field is None); the label is instead
+        drawn by a per-axes label layer, with an automatically computed
+        position.  If it is `LabelMode.Headless`, no artist is created and
+        nothing is drawn.
         """
+        if self._label_mode == LabelMode.Headless:
+            return self._add_headless_selection(pi)
         # pi: "pick_info", i.e. an incomplete selection.
         # Pre-fetch the figure and axes, as callbacks may actually unset them.
         figure = self._get_figure(pi.artist)
         axes = self._get_axes(pi.artist)
         if axes.get_renderer_cache() is None:
-            figure.canvas.draw()  # Needed by draw_artist below anyways.
+            with self._timer("draw"):
+                figure.canvas.draw()  # Needed by draw_artist below anyways.
         renderer = axes.get_renderer_cache()
-        ann = axes.annotate(
-            _pick_info.get_ann_text(*pi), xy=pi.target,
-            xytext=(np.nan, np.nan),
-            horizontalalignment=_MarkedStr("center"),
-            verticalalignment=_MarkedStr("center"),
-            visible=self.visible,
-            zorder=np.inf,
-            **self.annotation_kwargs)
-        ann.draggable(use_blit=not self._multiple)
+        if self._label_mode == LabelMode.Batched:
+            text = self._get_ann_text(pi)
+            ann = None
+        else:
+            # The default text is only computed if the callbacks don't set it.
+            ann = self._annotate(axes, "", pi.target)
+            finalize_text = _make_text_lazy(
+                ann, partial(self._get_ann_text, pi))
         extras = []
         if self._highlight:
             hl = self.add_highlight(*pi)
             if hl:
                 extras.append(hl)
         sel = pi._replace(annotation=ann, extras=extras)
-        self._selections.append(sel)
-        for cb in self._callbacks["add"]:
-            cb(sel)
-
+        self._register_selection(sel)
+
+        if ann is None:
+            # Check that the selection has not been removed by a callback.
+            if id(sel) in self._selections:
+                layer = self._get_label_layer(axes)
+                position = self.annotation_positions[self._auto_position(
+                    layer.get_template(sel.target, text),
+                    figure, axes, renderer)]
+                layer.add_label(id(sel), sel.target, text, position)
         # Check that `ann.axes` is still set, as callbacks may have removed the
         # annotation.
-        if ann.axes and ann.xyann == (np.nan, np.nan):
-            fig_bbox = figure.get_window_extent()
-            ax_bbox = axes.get_window_extent()
-            overlaps = []
-            for idx, annotation_position in enumerate(
-                    self.annotation_positions):
-                ann.set(**annotation_position)
-                # Work around matplotlib/matplotlib#7614: position update is
-                # missing.
-                ann.update_positions(renderer)
-                bbox = ann.get_window_extent(renderer)
-                overlaps.append(
-                    (_get_rounded_intersection_area(fig_bbox, bbox),
-                     _get_rounded_intersection_area(ax_bbox, bbox),
-                     # Avoid needlessly jumping around by breaking ties using
-                     # the last used position as default.
-                     idx == self._last_auto_position))
-            auto_position = max(range(len(overlaps)), key=overlaps.__getitem__)
-            ann.set(**self.annotation_positions[auto_position])
-            self._last_auto_position = auto_position
+        elif not ann.axes:
+            pass
+        elif ann.xyann == (np.nan, np.nan):
+            finalize_text()
+            ann.set(**self.annotation_positions[
+                self._auto_position(ann, figure, axes, renderer)])
         else:
+            finalize_text()
             if isinstance(ann.get_horizontalalignment(), _MarkedStr):
                 ann.set_horizontalalignment(
                     {-1: "right", 0: "center", 1: "left"}[
@@ -416,24 +1138,268 @@ class Cursor:
                         np.sign(np.nan_to_num(ann.xyann[1]))])
 
         if (extras
-                or len(self.selections) > 1 and not self._multiple
-                or not figure.canvas.supports_blit):
+                or ann is None
+                or not self._multiple and len(self._selections) > 1
+                or not figure.canvas.supports_blit
+                or self._pending_canvases is not None):
             # Either:
             #  - there may be more things to draw, or
             #  - annotation removal will make a full redraw necessary, or
-            #  - blitting is not (yet) supported.
-            figure.canvas.draw_idle()
+            #  - blitting is not (yet) supported, or
+            #  - the redraw is deferred to the end of a batch.
+            self._draw_idle(figure)
         elif ann.axes:
             # Fast path, only needed if the annotation has not been immediately
             # removed.
-            figure.draw_artist(ann)
-            figure.canvas.blit()
+            with self._timer("draw"):
+                figure.draw_artist(ann)
+                figure.canvas.blit()
         # Removal comes after addition so that the fast blitting path works.
         if not self._multiple:
-            for sel in self.selections[:-1]:
-                self.remove_selection(sel)
+            for other in self.selections[:-1]:
+                self.remove_selection(other)
+        self._submit_deferred(sel, figure)
         return sel
 
+    def _register_selection(self, sel):
+        """Index a new `Selection` and emit the ``"add"`` event."""
+        key = _selection_key(sel)
+        self._selections[id(sel)] = sel, key
+        self._selection_keys[key] += 1
+        for cb in [*self._callbacks["add"]]:  # Callbacks may disconnect.
+            if not isinstance(cb, _DeferredCallback):
+                cb(sel)
+
+    def _submit_deferred(self, sel, figure):
+        """
+        Submit the deferred ``"add"`` callbacks for *sel*, if it has not been
+        removed in the meantime.
+        """
+        if id(sel) not in self._selections:
+            return
+        futures = [cb.executor.submit(cb.func, sel)
+                   for cb in self._callbacks["add"]
+                   if isinstance(cb, _DeferredCallback)]
+        if not futures:
+            return
+        self._deferred_futures[id(sel)] = futures
+        for future in futures:
+            # May be called on a worker thread, hence only queue the result.
+            future.add_done_callback(
+                lambda future: self._deferred_results.append((sel, future)))
+        if self._deferred_timer is None:
+            self._deferred_timer = figure.canvas.new_timer(interval=20)
+            self._deferred_timer.add_callback(self._apply_deferred_results)
+        self._deferred_timer.start()
+
+    def _apply_deferred_results(self):
+        """
+        Update the labels of the selections whose deferred callbacks have
+        completed.
+        """
+        while self._deferred_results:
+            sel, future = self._deferred_results.popleft()
+            futures = self._deferred_futures.get(id(sel), [])
+            if future not in futures:  # Cancelled, or selection removed.
+                continue
+            futures.remove(future)
+            if not futures:
+                del self._deferred_futures[id(sel)]
+            text = future.result()  # Propagate exceptions.
+            if text is not None:
+                # The label may have been promoted to an annotation since.
+                sel, _ = self._selections[id(sel)]
+                self._set_label_text(sel, text)
+        if not self._deferred_futures:
+            self._deferred_timer.stop()
+
+    def _set_label_text(self, sel, text):
+        """Set the label text of a `Selection` and redraw it."""
+        figure = self._get_figure(sel.artist)
+        if sel.annotation is not None:
+            sel.annotation.set_text(text)
+        elif self._label_mode == LabelMode.Batched:
+            self._get_label_layer(self._get_axes(sel.artist)).set_label_text(
+                id(sel), text)
+        else:
+            toolbar = getattr(figure.canvas, "toolbar", None)
+            if toolbar is not None:
+                toolbar.set_message(text.replace("\n", "; "))
+            return
+        self._draw_idle(figure)
+
+    def _add_headless_selection(self, pi):
+        """Implementation of `add_selection` for `LabelMode.Headless`."""
+        toolbar = getattr(self._get_figure(pi.artist).canvas, "toolbar", None)
+        if toolbar is not None:
+            text = self._get_ann_text(pi)
+            toolbar.set_message(text.replace("\n", "; "))
+        sel = pi._replace(annotation=None, extras=[])
+        self._register_selection(sel)
+        if not self._multiple:
+            self.remove_selections(self.selections[:-1])
+        self._submit_deferred(sel, self._get_figure(pi.artist))
+        return sel
+
+    def _get_ann_text(self, pi):
+        """
+        Return the default label text of pick_info *pi*, from the labels bound
+        to its artist, if any, or from `get_ann_text`.
+        """
+        with self._timer("text", pi.artist):
+            binding_key, binding = self._get_label_binding(pi.artist)
+            if binding is not None:
+                text = binding.get_text(
+                    binding_key, getattr(pi.target, "index", None))
+                if text is not None:
+                    return text
+            return _pick_info.get_ann_text(*pi)
+
+    def _get_label_binding(self, artist):
+        """
+        Return the key under which labels are bound to *artist* (or
+        container), and the `_LabelBinding`, or None.
+        """
+        binding_key = (self._get_container_artist(artist)
+                       if isinstance(artist, Container) else artist)
+        binding = (self._label_bindings.get(binding_key)
+                   if binding_key is not None else None)
+        return binding_key, binding
+
+    def bind_labels(self, artist, labels):
+        r"""
+        Bind per-point labels to an artist (or container).
+
+        The default label text of a `Selection` on *artist* is then looked up
+        from *labels* by the selection's ``target.index``, instead of being
+        formatted by `get_ann_text`.  This replaces the common pattern of
+        setting the text from an ``"add"`` callback, without formatting a
+        default text which is then discarded.
+
+        Parameters
+        ----------
+        artist : Union[Artist, Container]
+            A selectable artist or container of this cursor.
+
+        labels : array-like or callable or None
+            Either an array of labels (indexed by position, even for pandas
+            `~pandas.Series`), or a vectorized formatter, which is called with
+            an array of indices and returns the sequence of corresponding
+            labels (where possible, it is called once for all the points of the
+            artist, and its results are cached).  Labels that are not strings
+            are converted with `str`.  Non-integer indices (e.g. when picking a
+            line between two points) are rounded to the nearest point (or, on
+            step plots, to the start of the step).  Tuple indices (e.g.
+            ``(segment, vertex)`` on `LineCollection`\s, ``(row, column)`` on
+            images) are rounded componentwise; an array of labels is indexed
+            by as many of their leading components as it has dimensions (so
+            that a 1D array labels each segment of a `LineCollection`), and a
+            formatter is called with an array of shape ``(n, len(index))``.
+            None unbinds the labels.
+        """
+        binding_key = (self._get_container_artist(artist)
+                       if isinstance(artist, Container) else artist)
+        if binding_key is None:
+            raise ValueError(f"{artist} is not selectable by this cursor")
+        if labels is None:
+            self._label_bindings.pop(binding_key, None)
+        else:
+            self._label_bindings[binding_key] = _LabelBinding(labels)
+
+    def _annotate(self, axes, text, xy):
+        """Create a draggable annotation, positioned by `add_selection`."""
+        ann = axes.annotate(
+            text, xy=xy,
+            xytext=(np.nan, np.nan),
+            horizontalalignment=_MarkedStr("center"),
+            verticalalignment=_MarkedStr("center"),
+            visible=self.visible,
+            zorder=np.inf,
+            **self.annotation_kwargs)
+        ann.draggable(use_blit=not self._multiple)
+        return ann
+
+    @_timed("position")
+    def _auto_position(self, ann, figure, axes, renderer):
+        """
+        Return the index of the annotation_positions entry that best fits
+        annotation *ann* within *axes* and *figure*.
+        """
+        fig_bbox = figure.get_window_extent()
+        ax_bbox = axes.get_window_extent()
+        overlaps = []
+        for idx, annotation_position in enumerate(self.annotation_positions):
+            ann.set(**annotation_position)
+            # Work around matplotlib/matplotlib#7614: position update is
+            # missing.
+            ann.update_positions(renderer)
+            bbox = ann.get_window_extent(renderer)
+            overlaps.append(
+                (_get_rounded_intersection_area(fig_bbox, bbox),
+                 _get_rounded_intersection_area(ax_bbox, bbox),
+                 # Avoid needlessly jumping around by breaking ties using the
+                 # last used position as default.
+                 idx == self._last_auto_position))
+        auto_position = max(range(len(overlaps)), key=overlaps.__getitem__)
+        self._last_auto_position = auto_position
+        return auto_position
+
+    def _get_label_layer(self, axes):
+        """Return the label layer of *axes*, creating it if needed."""
+        layer = self._label_layers.get(axes)
+        if layer is None or layer not in axes.artists:  # Cleared by `cla()`.
+            layer = self._label_layers[axes] = _LabelLayer(
+                axes, self.annotation_kwargs)
+            layer.set_visible(self.visible)
+        return layer
+
+    def _promote_label(self, event):
+        """
+        Replace the batched label under *event*, if any, by a draggable
+        annotation; return whether a label was promoted.
+        """
+        for axes, layer in self._label_layers.items():
+            if event.canvas is not layer.figure.canvas:
+                continue
+            sel_id = layer.label_at(event)
+            if sel_id is None:
+                continue
+            target, text, position = layer.pop_label(sel_id)
+            ann = self._annotate(axes, text, target)
+            ann.set(**position)
+            sel, key = self._selections[sel_id]
+            new = sel._replace(annotation=ann)
+            # Replace the selection in place, to preserve LIFO order, but keep
+            # indexing it by the original id (keeping the original selection
+            # alive), so that both selections can be passed to
+            # `remove_selection`, and deferred callbacks remain attached.
+            self._selections[sel_id] = new, key
+            self._promoted[id(new)] = sel
+            self._draw_idle(layer.figure)
+            return True
+        return False
+
+    def add_selections(self, pis):
+        r"""
+        Create annotations for multiple `Selection`\s and register them.
+
+        This is equivalent to calling `add_selection` on each element of *pis*
+        (and returns the list of new `Selection`\s), except that figures are
+        redrawn only once, at the end.
+        """
+        pis = [*pis]
+        if self._label_mode == LabelMode.Batched:
+            # Label texts are needed right away: format coordinates in bulk,
+            # so that `get_ann_text` then finds them in the cache.
+            targets = defaultdict(list)
+            for pi in pis:
+                if self._get_label_binding(pi.artist)[1] is None:
+                    targets[self._get_axes(pi.artist)].append(pi.target)
+            for ax, ax_targets in targets.items():
+                _pick_info._format_coords_unspaced(ax, ax_targets)
+        with self._batched_draws():
+            return [self.add_selection(pi) for pi in pis]
+
     def add_highlight(self, artist, *args, **kwargs):
         """
         Create, add, and return a highlighting artist.
@@ -452,16 +1418,131 @@ class Cursor:
             artist.axes.add_artist(hl)
             return hl
 
-    def connect(self, event, func=None):
+    def export_hover_table(self, file=None):
+        """
+        Precompute the hover labels of all selectable points, for the current
+        view.
+
+        This allows a client (e.g., a browser displaying a figure rendered with
+        the WebAgg or ipympl backends) to resolve hovers locally, without a
+        round trip to Python for each mouse motion.
+
+        Only artists with discrete points (lines, scatter plots, quivers and
+        barbs, bar, errorbar and stem plots) are exported; the table must be
+        recomputed whenever the ``"view_change"`` event (see `connect`) is
+        emitted.
+
+        Parameters
+        ----------
+        file : str or path-like or file-like, optional
+            If given, the table is also written there, as JSON.
+
+        Returns
+        -------
+        dict
+            A JSON-serializable dict with an ``"artists"`` entry, a list with
+            one dict per exported artist, with the following entries:
+
+            - ``"figure"``: an integer identifying the artist's figure
+              (figures are numbered in order of first appearance);
+            - ``"axes_bbox"``: the ``[x0, y0, x1, y1]`` extents of the axes;
+            - ``"pickradius"``: the pick radius;
+            - ``"xy"``: the positions of the points within the axes;
+            - ``"index"``: the indices of these points (as in
+              ``sel.target.index``);
+            - ``"text"``: the default annotation texts of these points (as
+              given by `get_ann_text`, or by `bind_labels`).
+
+            All positions and distances are in pixels, relative to the bottom
+            left of the figure.
+        """
+        figures = {}
+        entries = []
+        for artist in self.artists:
+            ax = artist.axes
+            if ax is None or not artist.get_visible():
+                continue
+            with self._timer("export", artist):
+                hover_targets = _pick_info._get_hover_targets(artist)
+                if hover_targets is None:
+                    continue
+                self._watch_view(ax)
+                indices, targets = hover_targets
+                xys = ax.transData.transform(targets)
+                bbox = ax.bbox.extents
+                aoc = getattr(artist, "container", artist)
+                child = (artist if aoc is artist
+                         else _pick_info._artist_in_container(aoc))
+                entry = dict(
+                    figure=figures.setdefault(artist.figure, len(figures)),
+                    axes_bbox=[*map(float, bbox)],
+                    pickradius=float(getattr(
+                        child, "get_pickradius",
+                        lambda: _pick_info.PATCH_PICKRADIUS)()),
+                    xy=[], index=[], text=[])
+                # Skip unpickable points, and points cropped by the axes.
+                with np.errstate(invalid="ignore"):
+                    shown, = np.nonzero(
+                        np.isfinite(xys).all(axis=1)
+                        & (bbox[:2] <= xys).all(axis=1)
+                        & (xys <= bbox[2:]).all(axis=1))
+                indices = np.asarray(indices)[shown]
+                targets = np.asarray(targets)[shown]
+                xys = xys[shown]
+                if self._get_label_binding(artist)[1] is None:
+                    # Format in bulk; `get_ann_text` then hits the cache.
+                    _pick_info._format_coords_unspaced(ax, targets)
+                for idx, target, xy in zip(indices, targets, xys):
+                    entry["xy"].append([*map(float, xy)])
+                    entry["index"].append(int(idx))
+                    entry["text"].append(self._get_ann_text(
+                        _pick_info.Selection(
+                            aoc, _pick_info._with_attrs(target, index=idx), 0,
+                            None, None)))
+                entries.append(entry)
+        table = {"artists": entries}
+        if file is not None:
+            with cbook.open_file_cm(file, "w", encoding="utf-8") as fh:
+                json.dump(table, fh)
+        return table
+
+    def _watch_view(self, ax):
+        """Emit the ``"view_change"`` event when *ax*'s view changes."""
+        if ax not in self._view_watched:
+            self._view_watched[ax] = True
+            cids = [ax.callbacks.connect(name, self._on_view_change)
+                    for name in ["xlim_changed", "ylim_changed"]]
+            self._disconnectors.extend(
+                partial(ax.callbacks.disconnect, cid) for cid in cids)
+        figure = ax.figure
+        if figure not in self._view_watched:
+            self._view_watched[figure] = True
+            canvas = figure.canvas
+            self._disconnectors.append(partial(
+                canvas.mpl_disconnect,
+                canvas.mpl_connect("resize_event", self._on_view_change)))
+
+    def _on_view_change(self, ax_or_event):
+        figure = getattr(ax_or_event, "figure", None)
+        if figure is None:  # A resize event.
+            figure = ax_or_event.canvas.figure
+        for cb in [*self._callbacks["view_change"]]:
+            cb(figure)
+
+    def connect(self, event, func=None, *, executor=None):
         """
         Connect a callback to a `Cursor` event; return the callback.
 
-        Two events can be connected to:
+        Three events can be connected to:
 
         - callbacks connected to the ``"add"`` event are called when a
           `Selection` is added, with that selection as only argument;
         - callbacks connected to the ``"remove"`` event are called when a
-          `Selection` is removed, with that selection as only argument.
+          `Selection` is removed, with that selection as only argument;
+        - callbacks connected to the ``"view_change"`` event are called when
+          the limits of an axes, or the size of a figure, change after
+          `export_hover_table` has been called on it (thus invalidating the
+          exported table), with the figure as only argument.
 
         This method can also be used as a decorator::
 
@@ -486,14 +1567,63 @@ class Cursor:
         it, in particular, to "cancel" the addition (by immediately removing
         the "new" selection) and thus avoid removing the "old" selection.
         However, this call order may change in a future release.
+
+        If an *executor* (a `concurrent.futures.Executor`) is passed, an
+        ``"add"`` callback is instead submitted to it once the selection has
+        been added and its label shown, so that slow callbacks (e.g. looking
+        up labels in a database) do not delay hovering.  As it runs outside of
+        the GUI thread, such a callback should not modify the selection, but
+        return the new label text (or None, to keep the default one); the
+        label is updated when the result arrives.  If the selection is removed
+        (e.g., superseded by a new hover) before the callback starts, the
+        callback is cancelled; if it is removed before the callback finishes,
+        its result is ignored.
         """
         if event not in self._callbacks:
             raise ValueError(f"{event!r} is not a valid cursor event")
+        if executor is not None and event != "add":
+            raise ValueError("Only 'add' callbacks can be run on an executor")
         if func is None:
-            return partial(self.connect, event)
-        self._callbacks[event].append(func)
+            return partial(self.connect, event, executor=executor)
+        self._callbacks[event].append(
+            func if executor is None else _DeferredCallback(func, executor))
         return func
 
+    def stream(self, event="add", *, maxsize=64, overflow="drop-oldest"):
+        """
+        Return an asynchronous iterator over the selections passed to the
+        callbacks of a cursor *event* (see `connect`).
+
+        This method must be called from a coroutine (the iterator is bound to
+        the running :mod:`asyncio` event loop)::
+
+            async for sel in cursor.stream():
+                ...
+
+        Selections are queued without blocking the GUI (and thus
+        `add_selection`), even if the consumer is slower than the events.  The
+        iteration stops when the cursor is removed, or when the iterator's
+        ``close`` (or ``aclose``) method is called (once the already queued
+        selections have been consumed).  Exiting an ``async for`` loop over
+        the iterator, or closing its event loop, also closes it.
+
+        Parameters
+        ----------
+        event : str, default: "add"
+            The cursor event whose selections are yielded.
+
+        maxsize : int, default: 64
+            The maximum number of queued selections.
+
+        overflow : {"drop-oldest", "coalesce"}, default: "drop-oldest"
+            What happens when a selection arrives while the queue is full:
+            either the oldest queued selection is dropped, or the newest
+            queued selection is replaced by the incoming one (so that the
+            consumer still sees the earliest pending selections, and the
+            latest one).
+        """
+        return _SelectionStream(self, event, maxsize, overflow)
+
     def disconnect(self, event, cb):
         """
         Disconnect a previously connected callback.
@@ -517,8 +1647,9 @@ class Cursor:
         """
         for disconnectors in self._disconnectors:
             disconnectors()
-        for sel in self.selections:
-            self.remove_selection(sel)
+        self.clear()
+        for stream in [*self._streams]:
+            stream.close()
         for s in type(self)._keep_alive.values():
             with suppress(KeyError):
                 s.remove(self)
@@ -526,7 +1657,9 @@ class Cursor:
     def _nonhover_handler(self, event):
         if event.name == "button_press_event":
             if _mouse_event_matches(event, self.bindings["select"]):
-                self._on_select_event(event)
+                if not (self._filter_mouse_event(event)
+                        and self._promote_label(event)):
+                    self._on_select_event(event)
             if _mouse_event_matches(event, self.bindings["deselect"]):
                 self._on_deselect_event(event)
 
@@ -539,6 +1672,10 @@ class Cursor:
               and _mouse_event_matches(event, self.bindings["deselect"])):
             # Still allow removing the annotation by right clicking.
             self._on_deselect_event(event)
+        elif (event.name == "button_press_event"
+              and _mouse_event_matches(event, self.bindings["select"])
+              and self._filter_mouse_event(event)):
+            self._promote_label(event)
 
     def _filter_mouse_event(self, event):
         # Accept the event iff we are enabled, and either
@@ -549,47 +1686,65 @@ class Cursor:
         return (self.enabled
                 and event.canvas.widgetlock.locked() == event.dblclick)
 
+    @_timed("event")
     def _on_select_event(self, event):
         if not self._filter_mouse_event(event):
             return
-        # Work around lack of support for twinned axes.
-        per_axes_event = {ax: _reassigned_axes_event(event, ax)
-                          for ax in {artist.axes for artist in self.artists}}
+        # Work around lack of support for twinned axes, by reassigning the
+        # event to each axes with candidate artists (None if the event is
+        # outside of the axes).
+        per_axes_event = {}
         pis = []
-        for artist in self.artists:
-            if (artist.axes is None  # Removed or figure-level artist.
-                    or event.canvas is not artist.figure.canvas
-                    or not artist.get_visible()
-                    or not artist.axes.contains(event)[0]):  # Cropped by axes.
-                continue
-            pi = _pick_info.compute_pick(artist, per_axes_event[artist.axes])
-            if pi:
-                pis.append(pi)
+        with _pick_info._using_screen_dtype(self._screen_dtype):
+            for artist in self.artists:
+                ax = artist.axes
+                if (ax is None  # Removed or figure-level artist.
+                        or event.canvas is not artist.figure.canvas
+                        or not artist.get_visible()):
+                    continue
+                if ax not in per_axes_event:
+                    per_axes_event[ax] = (
+                        _reassigned_axes_event(event, ax)
+                        # Axes patches lie within the axes bbox, whose check is
+                        # much cheaper than `Axes.contains`.
+                        if (ax.bbox.contains(event.x, event.y)
+                            and ax.contains(event)[0])
+                        else None)
+                if per_axes_event[ax] is None:  # Cropped by axes.
+                    continue
+                with self._timer("pick", artist):
+                    pi = _pick_info.compute_pick(artist, per_axes_event[ax])
+                if pi:
+                    pis.append(pi)
         # The any() check avoids picking an already selected artist at the same
         # point, as likely the user is just dragging it.  We check this here
         # rather than not adding the pick_info to pis at all, because in
         # transient hover mode, selections should be cleared out only when no
         # candidate picks (including such duplicates) exist at all.
         pi = min((pi for pi in pis
-                  if not any((pi.artist, tuple(pi.target))
-                             == (other.artist, tuple(other.target))
-                             for other in self._selections)),
+                  if _selection_key(pi) not in self._selection_keys),
                  key=lambda pi: pi.dist, default=None)
         if pi:
             self.add_selection(pi)
         elif not pis and self._hover == HoverMode.Transient:
-            for sel in self.selections:
-                if event.canvas is sel.annotation.figure.canvas:
-                    self.remove_selection(sel)
+            self.remove_selections(
+                sel for sel in self.selections
+                if event.canvas is self._get_figure(sel.artist).canvas)
 
     def _on_deselect_event(self, event):
         if not self._filter_mouse_event(event):
             return
+        batched_hits = {layer.label_at(event)
+                        for layer in self._label_layers.values()
+                        if event.canvas is layer.figure.canvas}
         for sel in self.selections[::-1]:  # LIFO.
             ann = sel.annotation
-            if event.canvas is not ann.figure.canvas:
+            if ann is None:
+                contained = id(sel) in batched_hits
+            elif event.canvas is not ann.figure.canvas:
                 continue
-            contained, _ = ann.contains(event)
+            else:
+                contained, _ = ann.contains(event)
             if contained:
                 self.remove_selection(sel)
                 break
@@ -609,24 +1764,57 @@ class Cursor:
                 self.add_selection(_pick_info.move(*sel, key=key))
                 break
 
+    @_timed("remove")
     def remove_selection(self, sel):
         """Remove a `Selection`."""
-        self._selections.remove(sel)
+        sel_id = id(self._promoted.get(id(sel), sel))
+        try:
+            # If *sel* was promoted, remove the promoted selection.
+            sel, key = self._selections.pop(sel_id)
+        except KeyError:
+            raise ValueError(f"{sel} is not a selection of this cursor")
+        self._promoted.pop(id(sel), None)
+        self._selection_keys[key] -= 1
+        if not self._selection_keys[key]:
+            del self._selection_keys[key]
+        for future in self._deferred_futures.pop(sel_id, []):
+            future.cancel()
         # <artist>.figure will be unset so we save them first.
-        figures = {artist.figure for artist in [sel.annotation] + sel.extras}
+        figures = {artist.figure for artist in [sel.annotation] + sel.extras
+                   if artist is not None}
+        if sel.annotation is None:
+            for layer in self._label_layers.values():
+                if layer.pop_label(sel_id):
+                    figures.add(layer.figure)
         # ValueError is raised if the artist has already been removed.
-        with suppress(ValueError):
-            sel.annotation.remove()
+        if sel.annotation is not None:
+            with suppress(ValueError):
+                sel.annotation.remove()
         for artist in sel.extras:
             with suppress(ValueError):
                 artist.remove()
-        for cb in self._callbacks["remove"]:
+        for cb in [*self._callbacks["remove"]]:  # Callbacks may disconnect.
             cb(sel)
         for figure in figures:
-            figure.canvas.draw_idle()
+            self._draw_idle(figure)
+
+    def remove_selections(self, sels):
+        r"""
+        Remove multiple `Selection`\s.
+
+        This is equivalent to calling `remove_selection` on each element of
+        *sels*, except that figures are redrawn only once, at the end.
+        """
+        with self._batched_draws():
+            for sel in [*sels]:
+                self.remove_selection(sel)
+
+    def clear(self):
+        r"""Remove all `Selection`\s."""
+        self.remove_selections(self.selections)
 
 
-def cursor(pickables=None, **kwargs):
+def cursor(pickables=None, *, track=False, **kwargs):
     """
     Create a `Cursor` for a list of artists, containers, and axes.
 
@@ -641,10 +1829,20 @@ def cursor(pickables=None, **kwargs):
         work when relying on pyplot, not when figures are directly instantiated
         (e.g., when manually embedding Matplotlib in a GUI toolkit).
 
+    track : bool, default: False
+        Whether artists and containers later added to any of the axes or
+        figures passed in *pickables* (or to any of the figures that pyplot is
+        tracking, if *pickables* is None) are also made selectable, as they
+        get added.  The cursor then stays alive as long as these axes or
+        figures do.
+
     **kwargs
         Keyword arguments are passed to the `Cursor` constructor.
     """
 
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+
     if pickables is None:
         # Do not import pyplot ourselves to avoid forcing the backend.
         plt = sys.modules.get("matplotlib.pyplot")
@@ -653,6 +1851,8 @@ def cursor(pickables=None, **kwargs):
     elif (isinstance(pickables, Container)
           or not isinstance(pickables, Iterable)):
         pickables = [pickables]
+    else:
+        pickables = [*pickables]
 
     def iter_unpack_figures(pickables):
         for entry in pickables:
@@ -681,4 +1881,9 @@ def cursor(pickables=None, **kwargs):
         if contained:
             artists.append(_pick_info.ContainerArtist(container))
 
-    return Cursor(artists, **kwargs)
+    cursor = Cursor(artists, **kwargs)
+    if track:
+        for entry in pickables:
+            if isinstance(entry, (Axes, Figure)):
+                cursor._track(entry)
+    return cursor
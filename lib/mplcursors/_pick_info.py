@@ -2,70 +2,164 @@
 # have a `format_coord`-like method); PolyCollection (picking is not well
 # defined).
 
+from abc import ABC, abstractmethod
 from collections import namedtuple
-from contextlib import suppress
+from contextlib import contextmanager
+import contextvars
 import copy
 import functools
+import importlib
 import inspect
 from inspect import Signature
 import itertools
-from numbers import Integral
+from numbers import Integral, Real
 import re
+import sys
 import warnings
-from weakref import WeakSet
+from weakref import WeakKeyDictionary
 
 from matplotlib import cbook
-from matplotlib.axes import Axes
-from matplotlib.backend_bases import RendererBase
-from matplotlib.collections import (
-    LineCollection, PatchCollection, PathCollection)
-from matplotlib.container import BarContainer, ErrorbarContainer, StemContainer
-from matplotlib.figure import Figure
-from matplotlib.image import AxesImage
-from matplotlib.lines import Line2D
-from matplotlib.patches import Patch, PathPatch, Polygon, Rectangle
-from matplotlib.quiver import Barbs, Quiver
-from matplotlib.text import Text
-from matplotlib.transforms import Affine2D
+from matplotlib.transforms import (
+    Affine2D, IdentityTransform, TransformedPath, TransformNode)
 import numpy as np
 
 
 PATCH_PICKRADIUS = 5  # FIXME Patches do not provide `pickradius`.
 
 
-def _register_scatter():
+# Implementations for Matplotlib artist classes are registered lazily (see
+# `_lazy_register`), so that importing mplcursors does not import most of
+# Matplotlib (in particular `matplotlib.axes`, which is slow to import).
+_pending_registrations = []
+
+
+def _lazy_register(generic, qualname):
     """
-    Patch `PathCollection` and `scatter` to register their return values.
+    Decorator registering an implementation of the single-dispatch function
+    *generic* for the class with the fully qualified name *qualname*.
 
-    This registration allows us to distinguish `PathCollection`s created by
-    `Axes.scatter`, which should use point-like picking, from others, which
-    should use path-like picking.  The former is more common, so we store the
-    latter instead; this also lets us guess the type better if this module is
-    imported late.
+    The registration is only performed by `_register_pending`.
+    """
+    def decorator(impl):
+        _pending_registrations.append((generic, qualname, impl))
+        return impl
+    return decorator
+
+
+def _register_pending():
+    """
+    Perform all pending registrations.
+
+    This is called by `Cursor` and by the single-dispatch functions of this
+    module, whenever their ``register`` or ``dispatch`` methods are called or
+    dispatching falls back to their default implementation.
     """
+    if not _pending_registrations:
+        return
+    _register_scatter()
+    for generic, qualname, impl in _pending_registrations:
+        modname, clsname = qualname.rsplit(".", 1)
+        generic.register.__wrapped__(
+            getattr(importlib.import_module(modname), clsname), impl)
+    _pending_registrations.clear()
+
+
+def _hook_register_pending(generic):
+    """
+    Make *generic* perform pending registrations before being used.
+    """
+    default = generic.dispatch(object)
+
+    @functools.wraps(default)
+    def fallback(*args, **kwargs):
+        if _pending_registrations:
+            _register_pending()
+            return generic(*args, **kwargs)  # Redispatch.
+        return default(*args, **kwargs)
+
+    generic.register(object, fallback)
+    for name in ["register", "dispatch"]:
+        method = getattr(generic, name)
+
+        @functools.wraps(method)
+        def wrapper(*args, _method=method, **kwargs):
+            _register_pending()
+            return _method(*args, **kwargs)
 
-    @functools.wraps(PathCollection.__init__)
-    def __init__(self, *args, **kwargs):
-        _nonscatter_pathcollections.add(self)
-        return __init__.__wrapped__(self, *args, **kwargs)
-    PathCollection.__init__ = __init__
+        setattr(generic, name, wrapper)
+
+
+def _register_scatter():
+    r"""
+    Patch `Axes.scatter` to mark its return values.
+
+    This marking allows us to distinguish `PathCollection`\s created by
+    `Axes.scatter`, which should use point-like picking, from others, which
+    should use path-like picking.  Only `Axes.scatter` is patched, so that
+    creating other `PathCollection`\s costs nothing.
+    """
+    from matplotlib.axes import Axes
 
     @functools.wraps(Axes.scatter)
     def scatter(*args, **kwargs):
         paths = scatter.__wrapped__(*args, **kwargs)
-        with suppress(KeyError):
-            _nonscatter_pathcollections.remove(paths)
+        paths._mplcursors_scatter = True
         return paths
     Axes.scatter = scatter
 
 
-_nonscatter_pathcollections = WeakSet()
-_register_scatter()
-
-
 def _is_scatter(artist):
+    r"""
+    Return whether *artist* is a `PathCollection` created by `Axes.scatter`.
+
+    Unmarked `PathCollection`\s may also have been created before the patching
+    (which happens if this module is imported before `matplotlib.axes` and no
+    `Cursor` is created before the first plots); they are considered as
+    scatter plots if they look like the ones created by `Axes.scatter` (a
+    single path, drawn with an identity transform at each offset).
+    """
+    from matplotlib.collections import PathCollection
     return (isinstance(artist, PathCollection)
-            and artist not in _nonscatter_pathcollections)
+            and (getattr(artist, "_mplcursors_scatter", False)
+                 or len(artist.get_paths()) == 1
+                 and isinstance(artist.get_transform(), IdentityTransform)))
+
+
+class _InvertedTransformCache(TransformNode):
+    """
+    Cache of the inverse of a transform, recomputed only after the transform
+    (or any of its children) is invalidated.
+    """
+
+    def __init__(self, transform):
+        super().__init__()
+        self._transform = transform
+        self._inverted = None
+        # Get notified of invalidations, as e.g. `TransformedPath` does.
+        self.set_children(transform)
+
+    def get_inverted(self):
+        if self._inverted is None or self._invalid:
+            # Computing the inverse also revalidates the transform's cached
+            # children, so that their next invalidation reaches us again.
+            self._inverted = self._transform.inverted()
+            self._invalid = 0
+        return self._inverted
+
+
+def _get_inverted_transform(transform):
+    """
+    Return ``transform.inverted()``, cached until *transform* is invalidated.
+
+    This avoids rebuilding the inverse of e.g. ``ax.transData`` for each event
+    and each pick.
+    """
+    try:
+        cache = transform._mplcursors_inverted
+    except AttributeError:
+        cache = transform._mplcursors_inverted = (
+            _InvertedTransformCache(transform))
+    return cache.get_inverted()
 
 
 def _artist_in_container(container):
@@ -201,23 +295,170 @@ class Index:
         return cls(i, x, y)
 
 
-def _compute_projection_pick(artist, path, xy):
+_CHUNK_SIZE = 2 ** 18  # Number of (query, item) pairs processed at once.
+
+
+def _iter_chunks(n_queries, n_items):
     """
-    Project *xy* on *path* to obtain a `Selection` for *artist*.
+    Yield slices splitting *n_queries* queries in chunks, such that each chunk
+    is tested against *n_items* items in at most ``_CHUNK_SIZE`` pairs (but
+    at least one query at a time).
+    """
+    step = max(1, _CHUNK_SIZE // max(n_items, 1))
+    for start in range(0, n_queries, step):
+        yield slice(start, start + step)
 
-    *path* is first transformed to screen coordinates using the artist
-    transform, and the target of the returned `Selection` is transformed
-    back to data coordinates using the artist *axes* inverse transform.  The
-    `Selection` `index` is returned as a float.  This function returns ``None``
-    for degenerate inputs.
 
-    The caller is responsible for converting the index to the proper class if
-    needed.
+def _nearest_points(points, xys):
+    """
+    Find, for each point in *xys*, the nearest non-nan point in *points*.
+
+    Return the indices of the nearest points, and the distances to them (nan
+    if all *points* are nan).
+    """
+    idxs = np.zeros(len(xys), int)
+    ds = np.full(len(xys), np.nan)
+    if not len(points):
+        return idxs, ds
+    for sl in _iter_chunks(len(xys), len(points)):
+        vs = xys[sl, None] - points
+        all_ds = np.hypot(vs[..., 0], vs[..., 1])
+        idxs[sl] = np.where(np.isnan(all_ds), np.inf, all_ds).argmin(axis=1)
+        ds[sl] = all_ds[np.arange(len(all_ds)), idxs[sl]]
+    return idxs, ds
+
+
+def _get_segments(starts, ends):
+    """
+    Return the unit vectors and the lengths of the segments from *starts* to
+    *ends* (e.g., ``vertices[:-1]`` and ``vertices[1:]`` for a polyline).
+    """
+    us = ends - starts
+    ls = np.hypot(*us.T)
+    with np.errstate(invalid="ignore"):
+        # Results in 0/0 for repeated consecutive points.
+        us /= ls[:, None]
+    return us, ls
+
+
+class _ProjectionScratch:
+    """
+    Scratch buffers for `_project_on_polyline`, reused across calls on
+    polylines with the same number of segments and dtype.
+    """
+
+    def __init__(self):
+        self._buffers = None
+
+    def get(self, n_rows, n_segments, dtype):
+        """
+        Return five float buffers (of *dtype*) and a boolean buffer, each of
+        shape ``(n_rows, n_segments)``.
+        """
+        buffers = self._buffers
+        if (buffers is None
+                or buffers[0].shape[0] < n_rows
+                or buffers[0].shape[1] != n_segments
+                or buffers[0].dtype != dtype):
+            buffers = self._buffers = (
+                *(np.empty((n_rows, n_segments), dtype) for _ in range(5)),
+                np.empty((n_rows, n_segments), bool))
+        return [buffer[:n_rows] for buffer in buffers]
+
+
+def _project_on_polyline(vertices, xys, segments=None, scratch=None):
+    """
+    Project each point in *xys* on the polyline through *vertices*.
+
+    The *segments* of the polyline, as returned by `_get_segments`, can be
+    passed if already known, as can a `_ProjectionScratch` to reuse across
+    calls; the computation is done in the dtype of *vertices* (float32
+    vertices trade precision for memory bandwidth).
+
+    Return the (float) indices of the projections (the segment index, plus the
+    position within the segment as a fraction of its length), the projections,
+    and the distances to them (nan if all projections are nan, e.g. if there
+    are less than two vertices).
+    """
+    if segments is None:
+        segments = _get_segments(vertices[:-1], vertices[1:])
+    argmin, fracs, projs, ds = _project_on_segments(
+        vertices[:-1], segments, xys, scratch)
+    return argmin + fracs, projs, ds
+
+
+def _project_on_segments(starts, segments, xys, scratch=None):
+    """
+    Project each point in *xys* on the nearest of the segments starting at
+    *starts*, with unit vectors and lengths *segments* (see `_get_segments`).
+
+    See `_project_on_polyline`, but return the indices of the nearest segments
+    and the positions of the projections within them separately.
     """
-    transform = artist.get_transform().frozen()
-    tpath = (path.cleaned(transform) if transform.is_affine
-             # `cleaned` only handles affine transforms.
-             else transform.transform_path(path).cleaned())
+    argmin = np.zeros(len(xys), int)
+    fracs = np.full(len(xys), np.nan)
+    projs = np.full((len(xys), 2), np.nan)
+    ds = np.full(len(xys), np.nan)
+    # Unit vectors and lengths of each segment.
+    us, ls = segments
+    if not len(us):
+        return argmin, fracs, projs, ds
+    if scratch is None:
+        scratch = _ProjectionScratch()
+    x0s, y0s = starts.T
+    uxs, uys = us.T
+    xys = np.asarray(xys, starts.dtype)
+    for sl in _iter_chunks(len(xys), len(us)):
+        xs = xys[sl, 0, None]
+        ys = xys[sl, 1, None]
+        vxs, vys, dot, pxs, pys, invalid = scratch.get(len(xs), len(us),
+                                                       starts.dtype)
+        # Vectors from each vertex to each query.
+        np.subtract(xs, x0s, out=vxs)
+        np.subtract(ys, y0s, out=vys)
+        # Clipped dot products.  `clip` can trigger invalid comparisons if
+        # there are nan points.
+        np.multiply(vxs, uxs, out=dot)
+        np.multiply(vys, uys, out=pxs)
+        np.add(dot, pxs, out=dot)
+        with np.errstate(invalid="ignore"):
+            np.clip(dot, 0, ls, out=dot)
+        # Projections.
+        np.multiply(dot, uxs, out=pxs)
+        np.add(x0s, pxs, out=pxs)
+        np.multiply(dot, uys, out=pys)
+        np.add(y0s, pys, out=pys)
+        # Distances to the projections.
+        np.subtract(xs, pxs, out=vxs)
+        np.subtract(ys, pys, out=vys)
+        all_ds = np.hypot(vxs, vys, out=vxs)
+        np.isnan(all_ds, out=invalid)
+        np.copyto(all_ds, np.inf, where=invalid)
+        chunk_argmin = argmin[sl] = all_ds.argmin(axis=1)
+        rows = np.arange(len(chunk_argmin))
+        fracs[sl] = (dot[rows, chunk_argmin].astype(float)
+                     / ls[chunk_argmin].astype(float))
+        projs[sl, 0] = pxs[rows, chunk_argmin]
+        projs[sl, 1] = pys[rows, chunk_argmin]
+        ds[sl] = np.where(invalid[rows, chunk_argmin],
+                          np.nan, all_ds[rows, chunk_argmin])
+    return argmin, fracs, projs, ds
+
+
+def _get_screen_polyline(path, transform):
+    """
+    Transform *path* to screen coordinates with *transform*, and return the
+    vertices of the resulting polyline, and its interpolation steps.
+    """
+    nonaffine_path, affine = (
+        # Avoid the overhead of `TransformedPath` on one-off transforms.
+        (path, transform.frozen()) if transform.is_affine
+        else (transform.transform_path_non_affine(path),
+              transform.get_affine()))
+    return _clean_polyline(nonaffine_path.cleaned(affine))
+
+
+def _clean_polyline(tpath):
     # `cleaned` should return a path where the first element is `MOVETO`, the
     # following are `LINETO` or `CLOSEPOLY`, and the last one is `STOP`, i.e.
     #     codes = path.codes
@@ -226,33 +467,554 @@ def _compute_projection_pick(artist, path, xy):
     vertices = tpath.vertices[:-1]
     codes = tpath.codes[:-1]
     vertices[codes == tpath.CLOSEPOLY] = vertices[0]
-    # Unit vectors for each segment.
-    us = vertices[1:] - vertices[:-1]
-    ls = np.hypot(*us.T)
+    return vertices, tpath._interpolation_steps
+
+
+class _ScreenCache(TransformNode, ABC):
+    """
+    Base class for caches of screen-space geometry (computed by `_compute`),
+    recomputed only after *transform* is invalidated (e.g., by a view change).
+    """
+
+    def __init__(self, transform):
+        super().__init__()
+        self.transform = transform
+        self._value = None
+        self.set_children(transform)
+
+    def get(self):
+        """Return the result of `_compute`, recomputing it if needed."""
+        if self._value is None or self._invalid:
+            self._value = (self._compute(),)  # Also cache None.
+            self._invalid = 0
+        value, = self._value
+        return value
+
+    @abstractmethod
+    def _compute(self):
+        """Compute the cached geometry."""
+
+
+class _ScreenPolylineCache(_ScreenCache):
+    """
+    Cache of the screen polyline of a path (see `_get_screen_polyline`) and of
+    its segments, together with the scratch buffers used to project on it.
+
+    The non-affine part of the transform is applied via a `TransformedPath`,
+    which caches it separately: e.g., on log axes, panning and zooming only
+    require reapplying the affine part.
+    """
+
+    def __init__(self, path, transform, dtype=np.float64):
+        super().__init__(transform)
+        self.path = path
+        self.dtype = np.dtype(dtype)
+        self.scratch = _ProjectionScratch()
+        self._tpath = TransformedPath(path, transform)
+
+    def _compute(self):
+        # Return the vertices, segments, and interpolation steps.
+        nonaffine_path, affine = self._tpath.get_transformed_path_and_affine()
+        vertices, steps = _clean_polyline(nonaffine_path.cleaned(affine))
+        vertices = vertices.astype(self.dtype, copy=False)
+        return (vertices, _get_segments(vertices[:-1], vertices[1:]), steps)
+
+
+# dtype of the screen coordinates of the polylines projected on, as set by the
+# *screen_dtype* parameter of `compute_picks` and `Cursor`.
+_screen_dtype = contextvars.ContextVar(
+    "_screen_dtype", default=np.dtype(np.float64))
+
+
+def _check_screen_dtype(dtype):
+    """Normalize a *screen_dtype* parameter to a `numpy.dtype`."""
+    dtype = np.dtype(dtype)
+    if dtype not in [np.float64, np.float32]:
+        raise ValueError(
+            f"screen_dtype must be float64 or float32, not {dtype}")
+    return dtype
+
+
+@contextmanager
+def _using_screen_dtype(dtype):
+    """Context manager setting the *screen_dtype* used for picking."""
+    token = _screen_dtype.set(_check_screen_dtype(dtype))
+    try:
+        yield
+    finally:
+        _screen_dtype.reset(token)
+
+
+def _compute_projection_picks(artist, path, xys, *, cache=False):
+    """
+    Project each point in *xys* on *path*, for *artist*.
+
+    *path* is first transformed to screen coordinates using the artist
+    transform, and the targets are transformed back to data coordinates using
+    the artist *axes* inverse transform.  Return the indices (as floats), the
+    targets, and the distances (nan where nothing can be picked).
+
+    If *cache* is set, the transformed path is cached on the artist (until the
+    path or the transform change), together with scratch buffers for the
+    projection; this should only be used for paths that persist across calls,
+    such as the path of a `Line2D`.
+
+    The caller is responsible for converting the indices to the proper class if
+    needed.
+    """
+    transform = artist.get_transform()
+    dtype = _screen_dtype.get()
+    if cache:
+        polyline_cache = getattr(artist, "_mplcursors_polyline_cache", None)
+        if (polyline_cache is None
+                or polyline_cache.path is not path
+                or polyline_cache.transform is not transform
+                or polyline_cache.dtype != dtype):
+            polyline_cache = artist._mplcursors_polyline_cache = (
+                _ScreenPolylineCache(path, transform, dtype))
+        vertices, segments, steps = polyline_cache.get()
+        scratch = polyline_cache.scratch
+    else:
+        vertices, steps = _get_screen_polyline(path, transform)
+        vertices = vertices.astype(dtype, copy=False)
+        segments = scratch = None
+    index, projs, ds = _project_on_polyline(vertices, xys, segments, scratch)
+    targets = _get_inverted_transform(artist.axes.transData).transform(projs)
+    index /= path._interpolation_steps / steps
+    return index, targets, ds
+
+
+def _compute_projection_pick(artist, path, xy):
+    """
+    Project *xy* on *path* to obtain a `Selection` for *artist*.
+
+    See `_compute_projection_picks`; this function returns ``None`` for
+    degenerate inputs.
+    """
+    (index,), (target,), (d,) = _compute_projection_picks(
+        artist, path, np.array([xy], float))
+    if np.isnan(d):
+        return
+    return Selection(artist, _with_attrs(target, index=index), d, None, None)
+
+
+def _transform_separable(transform, xy):
+    """
+    Transform *xy* with *transform*, which must be separable, treating both
+    coordinates independently.
+
+    Usually, an invalid (nan or infinite) coordinate of a point invalidates
+    both coordinates of the transformed point; here, it only invalidates
+    itself (and is set to nan).  Return None if no point is fully valid.
+    """
+    screen = transform.transform(xy)
+    invalid = ~np.isfinite(screen).all(axis=1)
+    if invalid.any():
+        if invalid.all():
+            return
+        ref = xy[invalid.argmin()]
+        for axis in range(2):
+            # Transform the other coordinate together with a valid one.
+            fixed = xy[invalid].copy()
+            fixed[:, 1 - axis] = ref[1 - axis]
+            screen[invalid, axis] = transform.transform(fixed)[:, axis]
+        screen[~np.isfinite(screen)] = np.nan
+    return screen
+
+
+def _get_screen_steps(xy, drawstyle, transform):
+    """
+    Return the horizontal and vertical segments of the step plot through *xy*
+    (with the given *drawstyle*), in screen coordinates.
+
+    Each family of segments is given as ``(fixed, starts, ends, offset)``,
+    where *fixed* are the constant coordinates of each segment, *starts* and
+    *ends* the varying ones, and *offset* the position of the first segment of
+    the family in the path of the step plot (the two families alternate).
+    Also return, if the screen *x* coordinates are monotonic (increasing or
+    decreasing) and all points are valid, the sign of their direction, the
+    (increasing) search keys ``sign * x``, and the bounding boxes of the
+    blocks of segments (see `_get_step_blocks`) (else, None three times).
+
+    Return None if *transform* does not keep segments axis-aligned.
+    """
+    if not transform.is_separable:
+        return
+    screen = _transform_separable(transform, xy)
+    if screen is None:
+        return
+    xs, ys = screen.T
+    if drawstyle == "steps-mid":
+        # Same as `pts_to_midstep`.
+        mids = _transform_separable(
+            transform,
+            np.column_stack([(xy[:-1, 0] + xy[1:, 0]) / 2, xy[:-1, 1]]))
+        if mids is None:
+            return
+        mids = mids[:, 0]
+        hs = (ys, np.concatenate([xs[:1], mids]),
+              np.concatenate([mids, xs[-1:]]), 0)
+        vs = (mids, ys[:-1], ys[1:], 1)
+    elif drawstyle == "steps-post":
+        hs = (ys[:-1], xs[:-1], xs[1:], 0)
+        vs = (xs[1:], ys[:-1], ys[1:], 1)
+    else:  # steps, steps-pre.
+        vs = (xs[:-1], ys[:-1], ys[1:], 0)
+        hs = (ys[1:], xs[:-1], xs[1:], 1)
+    sign = keys = blocks = None
+    if not np.isnan(screen).any():
+        if (xs[1:] >= xs[:-1]).all():
+            sign, keys = 1, xs
+        elif (xs[1:] <= xs[:-1]).all():
+            sign, keys = -1, -xs
+    if keys is not None:
+        blocks = _get_step_blocks(hs, vs)
+    return hs, vs, sign, keys, blocks
+
+
+# Number of consecutive segments (of each family) per block whose bounding box
+# is checked by `_project_on_steps`.
+_STEPS_BLOCK_SIZE = 32
+
+
+def _get_step_blocks(hs, vs):
+    """
+    Return the bounding boxes ``(x0, x1, y0, y1)`` (as four arrays) of the
+    blocks of ``_STEPS_BLOCK_SIZE`` consecutive segments of each family.
+    """
+    n_segments = max(len(hs[0]), len(vs[0]))
+    n_blocks = -(-n_segments // _STEPS_BLOCK_SIZE)
+    extrema = []
+    for coords in [[hs[1], hs[2], vs[0]], [hs[0], vs[1], vs[2]]]:  # x, y.
+        padded = np.full(
+            (len(coords), n_blocks * _STEPS_BLOCK_SIZE), np.nan)
+        for row, values in zip(padded, coords):
+            row[:len(values)] = values
+        padded = padded.reshape((len(coords), n_blocks, -1))
+        extrema.extend([np.fmin.reduce(np.fmin.reduce(padded, 2), 0),
+                        np.fmax.reduce(np.fmax.reduce(padded, 2), 0)])
+    return extrema
+
+
+class _ScreenStepsCache(_ScreenCache):
+    """Cache of the screen step segments of a step plot."""
+
+    def __init__(self, xy, drawstyle, transform):
+        super().__init__(transform)
+        self.xy = xy
+        self.drawstyle = drawstyle
+
+    def _compute(self):
+        return _get_screen_steps(self.xy, self.drawstyle, self.transform)
+
+
+def _project_on_axis_aligned(family, horizontal, xys):
+    """
+    Project each point in *xys* on a family of horizontal (or vertical)
+    segments, as returned by `_get_screen_steps`; the arrays of the family
+    may also be 2D, with one row of candidate segments per point.
+
+    Return the indices of the nearest segments within the family (or the
+    rows), the positions of the projections within these segments (as a
+    fraction of their lengths), the projections, and the distances to them
+    (nan if all projections are nan).  The computations match
+    `_project_on_polyline` exactly.
+    """
+    fixed, starts, ends, _ = family
+    along, across = (xys[:, 0, None], xys[:, 1, None]) if horizontal else (
+        xys[:, 1, None], xys[:, 0, None])
+    ls = np.abs(ends - starts)
     with np.errstate(invalid="ignore"):
-        # Results in 0/0 for repeated consecutive points.
-        us /= ls[:, None]
-    # Vectors from each vertex to the event (overwritten below).
-    vs = xy - vertices[:-1]
-    # Clipped dot products -- `einsum` cannot be done in place, `clip` can.
-    # `clip` can trigger invalid comparisons if there are nan points.
+        # Unit vectors are +/-1 (nan for empty segments).
+        us = (ends - starts) / ls
+        dot = np.clip((along - starts) * us, 0, ls)
+    projs_along = starts + dot * us
+    all_ds = (np.hypot(along - projs_along, across - fixed) if horizontal
+              else np.hypot(across - fixed, along - projs_along))
+    argmin = np.where(np.isnan(all_ds), np.inf, all_ds).argmin(axis=1)
+    rows = np.arange(len(argmin))
+    ls, fixed = [np.broadcast_to(a, all_ds.shape)[rows, argmin]
+                 for a in [ls, fixed]]
+    fracs = dot[rows, argmin] / ls
+    projs = np.column_stack([projs_along[rows, argmin], fixed])
+    if not horizontal:
+        projs = projs[:, ::-1]
+    return argmin, fracs, projs, all_ds[rows, argmin]
+
+
+# Number of segments (of each family) around the position of each query
+# checked first by `_project_on_steps`, to bound its distance to the plot.
+_STEPS_NEIGHBORHOOD = 16
+
+
+def _project_on_step_windows(hs, vs, xys, los, width):
+    """
+    Project each point in *xys* on the step plot with segment families *hs*
+    and *vs*, only checking, for the i-th point, the segments of each family
+    with indices in ``[los[i], los[i] + width)`` (clipped to the family).
+
+    Return the (float) path indices, the projections, and the distances, as
+    `_project_on_steps`.  At most ``_CHUNK_SIZE`` (query, segment) pairs are
+    processed at once; very wide windows are processed in blocks of segments,
+    from left to right.
+    """
+    index = np.full(len(xys), np.nan)
+    projs = np.full((len(xys), 2), np.nan)
+    ds = np.full(len(xys), np.nan)
+    block = max(1, min(width, _CHUNK_SIZE))
+    for sl in _iter_chunks(len(xys), block):
+        for block_start in range(0, width, block):
+            columns = np.arange(
+                block_start, min(block_start + block, width))
+            results = []
+            for family, horizontal in [(hs, True), (vs, False)]:
+                fixed, starts, ends, offset = family
+                if not len(fixed):
+                    nans = np.full(len(xys[sl]), np.nan)
+                    results.append(
+                        (nans, nans, np.full((len(nans), 2), np.nan), nans))
+                    continue
+                segs = np.minimum(
+                    los[sl, None] + columns, len(fixed) - 1)
+                argmin, fracs, family_projs, family_ds = (
+                    _project_on_axis_aligned(
+                        (fixed[segs], starts[segs], ends[segs], offset),
+                        horizontal, xys[sl]))
+                family_idx = segs[np.arange(len(segs)), argmin]
+                results.append(
+                    (2 * family_idx + offset, fracs, family_projs, family_ds))
+            (h_idx, h_fracs, h_projs, h_ds), (v_idx, v_fracs, v_projs, v_ds) \
+                = results
+            # Prefer the first segment in case of ties, as
+            # `_project_on_polyline` (blocks are processed in order, and only
+            # replace the results of previous blocks if strictly closer).
+            with np.errstate(invalid="ignore"):
+                use_v = (np.isnan(h_ds) & ~np.isnan(v_ds)
+                         | (v_ds < h_ds)
+                         | (v_ds == h_ds) & (v_idx < h_idx))
+                block_ds = np.where(use_v, v_ds, h_ds)
+                better = (np.isnan(ds[sl]) & ~np.isnan(block_ds)
+                          | (block_ds < ds[sl]))
+            rows = np.arange(len(ds))[sl][better]
+            index[rows] = np.where(
+                use_v, v_idx + v_fracs, h_idx + h_fracs)[better]
+            projs[rows] = np.where(use_v[:, None], v_projs, h_projs)[better]
+            ds[rows] = block_ds[better]
+    return index, projs, ds
+
+
+def _project_on_steps(steps, xys):
+    """
+    Project each point in *xys* on the step plot *steps* (as returned by
+    `_get_screen_steps`).
+
+    Return the (float) indices of the projections in the path of the step plot
+    (as for `_project_on_polyline`), the projections, and the distances to
+    them.  If the screen x coordinates are sorted, only blocks of segments
+    close enough to each query are checked.
+    """
+    hs, vs, sign, keys, blocks = steps
+    n_segments = max(len(hs[0]), len(vs[0]))
+    if keys is None or n_segments <= _STEPS_NEIGHBORHOOD:
+        return _project_on_step_windows(
+            hs, vs, xys, np.zeros(len(xys), int), n_segments)
+    # First project on a fixed neighborhood of segments around each query
+    # (in x); the distance to these segments bounds the distance to the step
+    # plot, so only segments within that distance need to be checked.
+    qs = sign * xys[:, 0]
+    los = (keys.searchsorted(qs) - _STEPS_NEIGHBORHOOD // 2).clip(
+        0, n_segments - _STEPS_NEIGHBORHOOD)
+    index, projs, ds = _project_on_step_windows(
+        hs, vs, xys, los, _STEPS_NEIGHBORHOOD)
+    # Margin for rounding errors; no bound if all these segments are empty.
+    bounds = np.where(np.isnan(ds), np.inf, ds * (1 + 1e-6) + 1)
+    # Segment i spans the x range of points i-1 to i+1 (for steps-mid).
+    starts = (keys.searchsorted(qs - bounds, "left") - 2).clip(0)
+    stops = np.minimum(
+        keys.searchsorted(qs + bounds, "right") + 2, n_segments)
+    todo, = np.nonzero((starts < los) | (stops > los + _STEPS_NEIGHBORHOOD))
+    if not len(todo):
+        return index, projs, ds
+    # Otherwise, check the blocks of segments overlapping the x range, by
+    # chunks of queries spanning at most ~_CHUNK_SIZE blocks overall.
+    first_blocks = starts[todo] // _STEPS_BLOCK_SIZE
+    stop_blocks = (stops[todo] - 1) // _STEPS_BLOCK_SIZE + 1
+    splits = np.flatnonzero(
+        np.diff((np.cumsum(stop_blocks - first_blocks) - 1) // _CHUNK_SIZE)
+    ) + 1
+    for sl in map(slice, [0, *splits], [*splits, len(todo)]):
+        rows = todo[sl]
+        index[rows], projs[rows], ds[rows] = _project_on_step_blocks(
+            hs, vs, blocks, xys[rows],
+            first_blocks[sl], stop_blocks[sl], bounds[rows])
+    return index, projs, ds
+
+
+def _project_on_step_blocks(hs, vs, blocks, xys, first_blocks, stop_blocks,
+                            bounds):
+    """
+    Project each point in *xys* on the blocks of ``_STEPS_BLOCK_SIZE`` segments
+    of the step plot ``(hs, vs)`` with indices from *first_blocks* to
+    *stop_blocks* (exclusive), ignoring the blocks whose bounding box (from
+    *blocks*) is farther than *bounds*, which must be at least the distance
+    to the nearest segment.
+
+    Return the indices, projections, and distances, as `_project_on_steps`.
+    """
+    # List the (query, block) pairs, with the distance from each query to the
+    # block's bounding box.
+    n_pair_blocks = stop_blocks - first_blocks
+    pair_queries = np.repeat(np.arange(len(xys)), n_pair_blocks)
+    group_starts = np.cumsum(n_pair_blocks) - n_pair_blocks
+    pair_blocks = (np.arange(len(pair_queries))
+                   + np.repeat(first_blocks - group_starts, n_pair_blocks))
+    x0, x1, y0, y1 = [extrema[pair_blocks] for extrema in blocks]
+    x, y = xys[pair_queries].T
     with np.errstate(invalid="ignore"):
-        dot = np.clip(np.einsum("ij,ij->i", vs, us), 0, ls, out=vs[:, 0])
-    # Projections.
-    projs = vertices[:-1] + dot[:, None] * us
-    ds = np.hypot(*(xy - projs).T, out=vs[:, 1])
-    try:
-        argmin = np.nanargmin(ds)
-        dmin = ds[argmin]
-    except (ValueError, IndexError):  # See above re: exceptions caught.
+        pair_bounds = np.hypot(np.fmax(np.fmax(x0 - x, x - x1), 0),
+                               np.fmax(np.fmax(y0 - y, y - y1), 0))
+    # Tighten the bounds by projecting on the nearest block of each query
+    # (which typically contains the nearest segment), then only keep the
+    # blocks within the bounds.
+    hits, = np.nonzero(pair_bounds == np.repeat(
+        np.fmin.reduceat(pair_bounds, group_starts), n_pair_blocks))
+    hit_queries = pair_queries[hits]
+    firsts = np.diff(hit_queries, prepend=-1) != 0  # Pairs are sorted.
+    queries = hit_queries[firsts]
+    _, _, nearest_ds = _project_on_step_windows(
+        hs, vs, xys[queries], pair_blocks[hits[firsts]] * _STEPS_BLOCK_SIZE,
+        _STEPS_BLOCK_SIZE)
+    bounds = bounds.copy()
+    bounds[queries] = np.fmin(bounds[queries], nearest_ds * (1 + 1e-6) + 1)
+    with np.errstate(invalid="ignore"):
+        close = pair_bounds <= bounds[pair_queries]
+    pair_queries = pair_queries[close]
+    pair_index, pair_projs, pair_ds = _project_on_step_windows(
+        hs, vs, xys[pair_queries],
+        pair_blocks[close] * _STEPS_BLOCK_SIZE, _STEPS_BLOCK_SIZE)
+    # For each query, keep the nearest projection, preferring the first
+    # segment in case of ties (as `_project_on_polyline`).
+    order = np.lexsort((pair_index, np.where(np.isnan(pair_ds), np.inf,
+                                             pair_ds), pair_queries))
+    best = order[np.unique(pair_queries[order], return_index=True)[1]]
+    return pair_index[best], pair_projs[best], pair_ds[best]
+
+
+def _compute_steps_picks(artist, xys):
+    """
+    Pick *artist*, a `Line2D` with a steps drawstyle, at each point in *xys*.
+
+    The step segments are handled analytically from the data points, rather
+    than by projecting on the (twice longer) path of the step plot.  Return
+    the same results as `_compute_projection_picks`, or None if the artist
+    transform does not keep segments axis-aligned (e.g. polar axes).
+    """
+    xy = artist.get_xydata()
+    drawstyle = artist.get_drawstyle()
+    transform = artist.get_transform()
+    if artist.get_path()._interpolation_steps != 1:
         return
-    else:
-        target = AttrArray(
-            artist.axes.transData.inverted().transform(projs[argmin]))
-        target.index = (
-            (argmin + dot[argmin] / ls[argmin])
-            / (path._interpolation_steps / tpath._interpolation_steps))
-        return Selection(artist, target, dmin, None, None)
+    steps_cache = getattr(artist, "_mplcursors_steps_cache", None)
+    if (steps_cache is None
+            or steps_cache.xy is not xy
+            or steps_cache.drawstyle != drawstyle
+            or steps_cache.transform is not transform):
+        steps_cache = artist._mplcursors_steps_cache = (
+            _ScreenStepsCache(xy, drawstyle, transform))
+    steps = steps_cache.get()
+    if steps is None:
+        return
+    index, projs, ds = _project_on_steps(steps, np.asarray(xys, float))
+    targets = _get_inverted_transform(artist.axes.transData).transform(projs)
+    return index, targets, ds
+
+
+class _ScreenSegmentsCache(_ScreenCache):
+    """
+    Cache of the screen segments of a collection whose paths are all single
+    segments (e.g., the error bars of `errorbar` and the stems of `stem`).
+    """
+
+    def __init__(self, paths, offsets, transform):
+        super().__init__(transform)
+        self.paths = paths
+        self.offsets = offsets
+        self.scratch = _ProjectionScratch()
+        self._vertices = (
+            # The artist transform must not bend segments (e.g. polar axes)
+            # (for which `transform_path_non_affine` would interpolate them).
+            np.concatenate([path.vertices for path in paths])
+            if (len(paths) and len(offsets) == 1
+                and (transform.is_affine or transform.is_separable)
+                and all(path.codes is None
+                        and path.vertices.shape == (2, 2)
+                        and path._interpolation_steps == 1
+                        for path in paths))
+            else None)
+
+    def _compute(self):
+        # Return the data-space vertices, and the screen-space starts and
+        # segments.
+        if self._vertices is None:
+            return
+        # Same as transforming each path (see `compute_pick`).
+        screen = self.transform.transform(
+            Affine2D().translate(*self.offsets[0]).transform(self._vertices))
+        starts = screen[::2]
+        return self._vertices, starts, _get_segments(starts, screen[1::2])
+
+
+def _compute_segments_picks(artist, xys):
+    """
+    Pick *artist*, a `Collection` whose paths are all single segments, at each
+    point in *xys*.
+
+    All segments are handled in a single pass.  Return the indices (as an
+    object array of ``(segment_index, position_in_segment)`` pairs), the
+    targets, and the distances (nan where nothing is picked), as the
+    per-segment picking in `compute_pick` would, or None if *artist* does not
+    consist of single segments.
+    """
+    paths = artist.get_paths()
+    offsets = artist.get_offsets()
+    transform = artist.get_transform()
+    segments_cache = getattr(artist, "_mplcursors_segments_cache", None)
+    if (segments_cache is None
+            or segments_cache.paths is not paths
+            or segments_cache.offsets is not offsets
+            or segments_cache.transform is not transform):
+        segments_cache = artist._mplcursors_segments_cache = (
+            _ScreenSegmentsCache(paths, offsets, transform))
+    segments = segments_cache.get()
+    if segments is None:
+        return
+    _, starts, segments = segments
+    argmin, fracs, projs, ds = _project_on_segments(
+        starts, segments, np.asarray(xys, float), segments_cache.scratch)
+    targets = _get_inverted_transform(artist.axes.transData).transform(projs)
+    index = np.full(len(xys), None, object)
+    with np.errstate(invalid="ignore"):
+        picked = ds < artist.get_pickradius()
+    for i in np.flatnonzero(picked):
+        index[i] = (int(argmin[i]), fracs[i])
+    targets[~picked] = np.nan
+    ds[~picked] = np.nan
+    return index, targets, ds
+
+
+def _get_segment_end(artist, idx):
+    """
+    Return the last vertex of the *idx*-th segment of *artist*, as
+    ``artist.get_segments()[idx][-1]`` (without computing all segments).
+    """
+    segments_cache = getattr(artist, "_mplcursors_segments_cache", None)
+    if (segments_cache is not None
+            and segments_cache.paths is artist.get_paths()
+            and segments_cache._vertices is not None):
+        return segments_cache._vertices[2 * idx + 1]
+    return np.vstack([
+        vertex for vertex, _
+        in artist.get_paths()[idx].iter_segments(simplify=False)])[-1]
 
 
 def _untransform(orig_xy, screen_xy, ax):
@@ -270,54 +1032,76 @@ def _untransform(orig_xy, screen_xy, ax):
     return (
         orig_xy
         if ((tr_xy == screen_xy) | np.isnan(tr_xy) & np.isnan(screen_xy)).all()
-        else ax.transData.inverted().transform(screen_xy))
+        else _get_inverted_transform(ax.transData).transform(screen_xy))
 
 
-@compute_pick.register(Line2D)
-def _(artist, event):
+def _compute_line2d_picks(artist, xys):
+    """
+    Pick *artist*, a `Line2D`, at each point in *xys* (in screen coordinates).
+
+    Return the indices (as an object array), the targets, and the distances
+    (nan where nothing is picked).
+    """
     # No need to call `line.contains` as we're going to redo the work anyways
     # (also see matplotlib/matplotlib#6645, though that's fixed in mpl2.1).
 
     # Always work in screen coordinates, as this is how we need to compute
     # distances.  Note that the artist transform may be different from the axes
     # transform (e.g., for axvline).
-    xy = event.x, event.y
     data_xy = artist.get_xydata()
-    data_screen_xy = artist.get_transform().transform(data_xy)
-    sels = []
+    index = np.full(len(xys), None, object)
+    targets = np.full((len(xys), 2), np.nan)
+    ds = np.full(len(xys), np.inf)
     # If markers are visible, find the closest vertex.
     if artist.get_marker() not in ["None", "none", " ", "", None]:
-        ds = np.hypot(*(xy - data_screen_xy).T)
-        try:
-            argmin = np.nanargmin(ds)
-        except ValueError:  # Raised by nanargmin([nan]).
-            pass
-        else:
-            target = _with_attrs(
-                _untransform(  # More precise than transforming back.
-                    data_xy[argmin], data_screen_xy[argmin], artist.axes),
-                index=argmin)
-            sels.append(Selection(artist, target, ds[argmin], None, None))
-    # If lines are visible, find the closest projection.
+        data_screen_xy = artist.get_transform().transform(data_xy)
+        argmin, vertex_ds = _nearest_points(data_screen_xy, xys)
+        picked = ~np.isnan(vertex_ds)
+        argmin = argmin[picked]
+        index[picked] = [*argmin]  # Keep numpy ints.
+        targets[picked] = _untransform(  # More precise than transforming back.
+            data_xy[argmin], data_screen_xy[argmin], artist.axes)
+        ds[picked] = vertex_ds[picked]
+    # If lines are visible, find the closest projection (if strictly closer).
     if (artist.get_linestyle() not in ["None", "none", " ", "", None]
             and len(artist.get_xydata()) > 1):
-        sel = _compute_projection_pick(artist, artist.get_path(), xy)
-        if sel is not None:
-            sel.target.index = {
-                "_draw_lines": lambda _, index: index,
-                "_draw_steps_pre": Index.pre_index,
-                "_draw_steps_mid": Index.mid_index,
-                "_draw_steps_post": Index.post_index}[
-                    Line2D.drawStyles[artist.get_drawstyle()]](
-                        len(data_xy), sel.target.index)
-            sels.append(sel)
-    sel = min(sels, key=lambda sel: sel.dist, default=None)
-    return sel if sel and sel.dist < artist.get_pickradius() else None
-
-
-@compute_pick.register(PathPatch)
-@compute_pick.register(Polygon)
-@compute_pick.register(Rectangle)
+        proj_picks = (_compute_steps_picks(artist, xys)
+                      if artist.get_drawstyle() != "default" else None)
+        if proj_picks is None:
+            proj_picks = _compute_projection_picks(
+                artist, artist.get_path(), xys, cache=True)
+        proj_index, proj_targets, proj_ds = proj_picks
+        with np.errstate(invalid="ignore"):
+            closer = proj_ds < ds
+        to_index = {
+            "_draw_lines": lambda _, index: index,
+            "_draw_steps_pre": Index.pre_index,
+            "_draw_steps_mid": Index.mid_index,
+            "_draw_steps_post": Index.post_index}[
+                artist.drawStyles[artist.get_drawstyle()]]
+        index[closer] = [to_index(len(data_xy), idx)
+                         for idx in proj_index[closer]]
+        targets[closer] = proj_targets[closer]
+        ds[closer] = proj_ds[closer]
+    missed = ~(ds < artist.get_pickradius())
+    index[missed] = None
+    targets[missed] = np.nan
+    ds[missed] = np.nan
+    return index, targets, ds
+
+
+@_lazy_register(compute_pick, "matplotlib.lines.Line2D")
+def _(artist, event):
+    (index,), (target,), (d,) = _compute_line2d_picks(
+        artist, np.array([[event.x, event.y]], float))
+    if np.isnan(d):
+        return None
+    return Selection(artist, _with_attrs(target, index=index), d, None, None)
+
+
+@_lazy_register(compute_pick, "matplotlib.patches.PathPatch")
+@_lazy_register(compute_pick, "matplotlib.patches.Polygon")
+@_lazy_register(compute_pick, "matplotlib.patches.Rectangle")
 def _(artist, event):
     sel = _compute_projection_pick(
         artist, artist.get_path(), (event.x, event.y))
@@ -325,9 +1109,9 @@ def _(artist, event):
         return sel
 
 
-@compute_pick.register(LineCollection)
-@compute_pick.register(PatchCollection)
-@compute_pick.register(PathCollection)
+@_lazy_register(compute_pick, "matplotlib.collections.LineCollection")
+@_lazy_register(compute_pick, "matplotlib.collections.PatchCollection")
+@_lazy_register(compute_pick, "matplotlib.collections.PathCollection")
 def _(artist, event):
     offsets = artist.get_offsets()
     paths = artist.get_paths()
@@ -348,17 +1132,26 @@ def _(artist, event):
             index=inds[argmin])
         return Selection(artist, target, ds[argmin], None, None)
     else:
+        picks = _compute_segments_picks(artist, [[event.x, event.y]])
+        if picks is not None:
+            (index,), (target,), (d,) = picks
+            if index is None:
+                return None
+            return Selection(
+                artist, _with_attrs(target, index=index), d, None, None)
         # Note that this won't select implicitly closed paths.
-        sels = [*filter(None, [
+        sels = [
             _compute_projection_pick(
                 artist,
                 Affine2D().translate(*offsets[ind % len(offsets)])
                 .transform_path(paths[ind % len(paths)]),
                 (event.x, event.y))
-            for ind in range(max(len(offsets), len(paths)))])]
-        if not sels:
+            for ind in range(max(len(offsets), len(paths)))]
+        # Keep the indices of the paths, even if some are unpickable.
+        idx = min((idx for idx, sel in enumerate(sels) if sel),
+                  key=lambda idx: sels[idx].dist, default=None)
+        if idx is None:
             return None
-        idx = min(range(len(sels)), key=lambda idx: sels[idx].dist)
         sel = sels[idx]
         if sel.dist >= artist.get_pickradius():
             return None
@@ -367,8 +1160,9 @@ def _(artist, event):
         return sel
 
 
-@compute_pick.register(AxesImage)
+@_lazy_register(compute_pick, "matplotlib.image.AxesImage")
 def _(artist, event):
+    from matplotlib.image import AxesImage
     if type(artist) != AxesImage:
         # Skip and warn on subclasses (`NonUniformImage`, `PcolorImage`) as
         # they do not implement `contains` correctly.  Even if they did, they
@@ -390,23 +1184,39 @@ def _(artist, event):
     return Selection(artist, target, 0, None, None)
 
 
-@compute_pick.register(Barbs)
-@compute_pick.register(Quiver)
-def _(artist, event):
+def _compute_offset_picks(artist, xys):
+    """
+    Pick *artist*, a `Quiver` or `Barbs`, at each point in *xys* (in screen
+    coordinates), by the nearest offset.
+
+    Return the indices, the targets, and the distances (nan where nothing is
+    picked).
+    """
     offsets = artist.get_offsets()
     offsets_screen = artist.get_offset_transform().transform(offsets)
-    ds = np.hypot(*(offsets_screen - [event.x, event.y]).T)
-    argmin = np.nanargmin(ds)
-    if ds[argmin] < artist.get_pickradius():
-        target = _with_attrs(
-            _untransform(offsets[argmin], offsets_screen[argmin], artist.axes),
-            index=argmin)
-        return Selection(artist, target, ds[argmin], None, None)
-    else:
+    argmin, ds = _nearest_points(offsets_screen, xys)
+    picked = ds < artist.get_pickradius()  # False for nans.
+    targets = np.full((len(xys), 2), np.nan)
+    targets[picked] = _untransform(
+        offsets[argmin[picked]], offsets_screen[argmin[picked]], artist.axes)
+    ds[~picked] = np.nan
+    index = argmin.astype(float)
+    index[~picked] = np.nan
+    return index, targets, ds
+
+
+@_lazy_register(compute_pick, "matplotlib.quiver.Barbs")
+@_lazy_register(compute_pick, "matplotlib.quiver.Quiver")
+def _(artist, event):
+    (index,), (target,), (d,) = _compute_offset_picks(
+        artist, np.array([[event.x, event.y]], float))
+    if np.isnan(d):
         return None
+    return Selection(
+        artist, _with_attrs(target, index=int(index)), d, None, None)
 
 
-@compute_pick.register(Text)
+@_lazy_register(compute_pick, "matplotlib.text.Text")
 def _(artist, event):
     return
 
@@ -416,7 +1226,7 @@ def _(artist, event):
     return compute_pick(artist.container, event)
 
 
-@compute_pick.register(BarContainer)
+@_lazy_register(compute_pick, "matplotlib.container.BarContainer")
 def _(container, event):
     try:
         (idx, patch), = {
@@ -436,7 +1246,7 @@ def _(container, event):
     return Selection(container, target, 0, None, None)
 
 
-@compute_pick.register(ErrorbarContainer)
+@_lazy_register(compute_pick, "matplotlib.container.ErrorbarContainer")
 def _(container, event):
     data_line, cap_lines, err_lcs = container
     sel_data = compute_pick(data_line, event) if data_line else None
@@ -456,8 +1266,9 @@ def _(container, event):
         return
 
 
-@compute_pick.register(StemContainer)
+@_lazy_register(compute_pick, "matplotlib.container.StemContainer")
 def _(container, event):
+    from matplotlib.collections import LineCollection
     sel = compute_pick(container.markerline, event)
     if sel:
         return sel
@@ -469,46 +1280,385 @@ def _(container, event):
     if sel:
         idx, _ = sel.target.index
         target = _with_attrs(
-            container.stemlines.get_segments()[idx][-1],
+            _get_segment_end(container.stemlines, idx),
             index=sel.target.index)
         return Selection(container, target, 0, None, None)
 
 
-def _call_with_selection(func):
-    """Decorator that passes a `Selection` built from the non-kwonly args."""
-    wrapped_kwonly_params = [
-        param for param in inspect.signature(func).parameters.values()
-        if param.kind == param.KEYWORD_ONLY]
+Picks = namedtuple("Picks", "index target dist")
+Picks.index.__doc__ = (
+    "The indices of the picked points within the artist (a float array if "
+    "they are all scalars, an object array otherwise), or nan (respectively "
+    "None) where nothing is picked.")
+Picks.target.__doc__ = (
+    "The picked points, in data coordinates, or nan where nothing is picked.")
+Picks.dist.__doc__ = (
+    "The distances from the queries to the targets, in pixels, or nan where "
+    "nothing is picked.")
+
+
+def compute_picks(artist, xys, *, coords="screen", screen_dtype=np.float64):
+    r"""
+    Find where *artist* is picked by each of the points *xys*.
+
+    This is the vectorized equivalent of calling `compute_pick` for each
+    point, without the need for actual events (and without creating any
+    annotation).
+
+    Parameters
+    ----------
+    artist : Union[Artist, Container]
+        The artist to pick.
+    xys : (N, 2) array-like
+        The queried points.
+    coords : {"screen", "data"}, default: "screen"
+        Whether *xys* are given in screen (pixel) coordinates, or in the data
+        coordinates of the artist axes.
+    screen_dtype : {float64, float32}, default: float64
+        The dtype of the screen coordinates of lines when projecting on them.
+        float32 halves the memory traffic of picking long lines (and the
+        memory used by their cached screen coordinates), at the cost of
+        precision (by a small fraction of a pixel).
+
+    Returns
+    -------
+    `Picks`
+        A namedtuple of arrays ``(index, target, dist)``, with one entry per
+        query, corresponding to the ``target.index``, ``target``, and
+        ``dist`` fields of the `Selection` that `compute_pick` would return.
+
+    Notes
+    -----
+    Picking is performed in a single batched pass for `Line2D`\s, `Quiver`\s,
+    `Barbs`, `LineCollection`\s of single segments (e.g. `vlines`), and
+    `errorbar` and `stem` plots; other artists fall back to one call to
+    `compute_pick` per point (via a fabricated `MouseEvent`).
+    """
+    from matplotlib.container import Container
+    xys = np.asarray(xys, float).reshape((-1, 2))
+    if coords == "data":
+        axes = (_artist_in_container(artist) if isinstance(artist, Container)
+                else artist).axes
+        xys = axes.transData.transform(xys)
+    elif coords != "screen":
+        raise ValueError(f"Invalid coords: {coords!r}")
+    with _using_screen_dtype(screen_dtype):
+        index, target, dist = _compute_picks(artist, xys)
+    if index.dtype == object and all(
+            idx is None or isinstance(idx, Real) for idx in index):
+        index = np.array(
+            [np.nan if idx is None else idx for idx in index], float)
+    return Picks(index, target, dist)
+
+
+@functools.singledispatch
+def _compute_picks(artist, xys):
+    """
+    Implementation of `compute_picks`, with *xys* in screen coordinates.
+
+    Return the indices (in any array), the targets, and the distances, with
+    nan distances where nothing is picked.
+    """
+    from matplotlib.backend_bases import MouseEvent
+    from matplotlib.container import Container
+    canvas = (_artist_in_container(artist) if isinstance(artist, Container)
+              else artist).figure.canvas
+    index = np.full(len(xys), None, object)
+    targets = np.full((len(xys), 2), np.nan)
+    ds = np.full(len(xys), np.nan)
+    for i, (x, y) in enumerate(xys):
+        sel = compute_pick(artist, MouseEvent("", canvas, x, y))
+        if sel:
+            index[i] = getattr(sel.target, "index", None)
+            targets[i] = sel.target
+            ds[i] = sel.dist
+    return index, targets, ds
+
+
+@_compute_picks.register(ContainerArtist)
+def _(artist, xys):
+    return _compute_picks(artist.container, xys)
+
+
+_lazy_register(_compute_picks, "matplotlib.lines.Line2D")(
+    _compute_line2d_picks)
+_lazy_register(_compute_picks, "matplotlib.quiver.Barbs")(
+    _compute_offset_picks)
+_lazy_register(_compute_picks, "matplotlib.quiver.Quiver")(
+    _compute_offset_picks)
+
+
+@_lazy_register(_compute_picks, "matplotlib.collections.LineCollection")
+def _(artist, xys):
+    picks = _compute_segments_picks(artist, xys)
+    return (picks if picks is not None
+            else _compute_picks.dispatch(object)(artist, xys))
+
+
+@_lazy_register(_compute_picks, "matplotlib.container.ErrorbarContainer")
+def _(container, xys):
+    data_line, cap_lines, err_lcs = container
+    if not data_line:  # We can't guess the original data in that case!
+        return (np.full(len(xys), None, object),
+                np.full((len(xys), 2), np.nan),
+                np.full(len(xys), np.nan))
+    index, targets, ds = _compute_line2d_picks(data_line, xys)
+    err_ds = np.full(len(xys), np.inf)
+    err_idxs = np.zeros(len(xys), int)
+    for err_lc in err_lcs:
+        lc_index, _, lc_ds = _compute_picks(err_lc, xys)
+        with np.errstate(invalid="ignore"):
+            closer = lc_ds < err_ds
+        err_ds[closer] = lc_ds[closer]
+        err_idxs[closer] = [idx for idx, _ in lc_index[closer]]
+    with np.errstate(invalid="ignore"):
+        use_err = ~(ds < err_ds) & (err_ds < np.inf)
+    err_idxs = err_idxs[use_err]
+    index[use_err] = err_idxs.tolist()
+    targets[use_err] = data_line.get_xydata()[err_idxs]
+    ds[use_err] = 0
+    return index, targets, ds
+
+
+@_lazy_register(_compute_picks, "matplotlib.container.StemContainer")
+def _(container, xys):
+    from matplotlib.collections import LineCollection
+    if not isinstance(container.stemlines, LineCollection):
+        return _compute_picks.dispatch(object)(container, xys)
+    index, targets, ds = _compute_line2d_picks(container.markerline, xys)
+    stem_index, _, stem_ds = _compute_picks(container.stemlines, xys)
+    use_stem = np.isnan(ds) & ~np.isnan(stem_ds)
+    index[use_stem] = stem_index[use_stem]
+    targets[use_stem] = [
+        _get_segment_end(container.stemlines, idx)
+        for idx, _ in stem_index[use_stem]]
+    ds[use_stem] = 0
+    return index, targets, ds
+
+
+@functools.singledispatch
+def _get_hover_targets(artist):
+    """
+    Return the discrete points that can be picked on *artist*, as a list of
+    indices and an array of targets (in data coordinates), or None if the
+    artist does not have such points (e.g., for images or patches).
+    """
+    return None
+
+
+@_lazy_register(_get_hover_targets, "matplotlib.lines.Line2D")
+def _(artist):
+    data_xy = artist.get_xydata()
+    return (range(len(data_xy)),
+            _untransform(data_xy, artist.get_transform().transform(data_xy),
+                         artist.axes))
+
+
+@_lazy_register(_get_hover_targets, "matplotlib.collections.PathCollection")
+def _(artist):
+    if not _is_scatter(artist):
+        return None
+    offsets = artist.get_offsets()
+    return (range(len(offsets)),
+            _untransform(
+                offsets, artist.get_offset_transform().transform(offsets),
+                artist.axes))
+
+
+@_lazy_register(_get_hover_targets, "matplotlib.quiver.Barbs")
+@_lazy_register(_get_hover_targets, "matplotlib.quiver.Quiver")
+def _(artist):
+    offsets = artist.get_offsets()
+    return range(len(offsets)), offsets
+
+
+@_get_hover_targets.register(ContainerArtist)
+def _(artist):
+    return _get_hover_targets(artist.container)
+
+
+@_lazy_register(_get_hover_targets, "matplotlib.container.BarContainer")
+def _(container):
+    targets = []
+    for patch in container.patches:
+        # As in `compute_pick`, snap to the non-sticky edges.
+        (x0, y0), (x1, y1) = patch.get_bbox().get_points()
+        xs = [x for x in [x0, x1] if x not in patch.sticky_edges.x]
+        ys = [y for y in [y0, y1] if y not in patch.sticky_edges.y]
+        targets.append([xs[0] if len(xs) == 1 else (x0 + x1) / 2,
+                        ys[0] if len(ys) == 1 else (y0 + y1) / 2])
+    return range(len(targets)), np.reshape(targets, (-1, 2))
+
+
+@_lazy_register(_get_hover_targets, "matplotlib.container.ErrorbarContainer")
+def _(container):
+    data_line, cap_lines, err_lcs = container
+    if not data_line:
+        return None
+    xys = data_line.get_xydata()
+    return range(len(xys)), xys
+
+
+@_lazy_register(_get_hover_targets, "matplotlib.container.StemContainer")
+def _(container):
+    return _get_hover_targets(container.markerline)
+
+
+@functools.lru_cache(None)
+def _get_selection_signatures():
+    """
+    Return the signature of `Selection`, and the same signature with None
+    defaults for all parameters.
+    """
     sel_sig = inspect.signature(Selection)
     default_sel_sig = sel_sig.replace(
-        parameters=[param.replace(default=None) if param.default is param.empty
-                    else param
+        parameters=[param.replace(default=None)
+                    if param.default is param.empty else param
                     for param in sel_sig.parameters.values()])
+    return sel_sig, default_sel_sig
+
 
-    @functools.wraps(func)
-    def wrapper(*args, **kwargs):
+class _CallWithSelection:
+    """
+    Wrapper that passes a `Selection` built from the non-kwonly args to the
+    wrapped function; see `_call_with_selection`.
+
+    The signature of the wrapped function is only inspected when needed (on
+    a slow path call, or for introspection), not when wrapping it at import
+    time.
+    """
+
+    def __init__(self, func):
+        functools.update_wrapper(self, func)
+        self._func = func
+        self._n_fields = len(Selection._fields)
+        self._kwonly_params = None
+
+    def __call__(self, *args, **kwargs):
+        # Fast path for the common case of an unpacked Selection (`f(*sel)`),
+        # where the remaining kwargs can only be keyword-only arguments (and
+        # if not, `func` raises the appropriate TypeError).
+        if len(args) == self._n_fields:
+            return self._func(Selection(*args), **kwargs)
         extra_kw = {param.name: kwargs.pop(param.name)
-                    for param in wrapped_kwonly_params if param.name in kwargs}
+                    for param in self._get_kwonly_params()
+                    if param.name in kwargs}
+        _, default_sel_sig = _get_selection_signatures()
         ba = default_sel_sig.bind(*args, **kwargs)
         ba.apply_defaults()
         sel = Selection(*ba.args, **ba.kwargs)
-        return func(sel, **extra_kw)
+        return self._func(sel, **extra_kw)
 
-    wrapper.__signature__ = Signature(
-        [*sel_sig.parameters.values(), *wrapped_kwonly_params])
-    return wrapper
+    def _get_kwonly_params(self):
+        if self._kwonly_params is None:
+            self._kwonly_params = [
+                param
+                for param in inspect.signature(self._func).parameters.values()
+                if param.kind == param.KEYWORD_ONLY]
+        return self._kwonly_params
 
+    @property
+    def __signature__(self):
+        sel_sig, _ = _get_selection_signatures()
+        return Signature(
+            [*sel_sig.parameters.values(), *self._get_kwonly_params()])
 
-def _format_coord_unspaced(ax, xy):
+
+def _call_with_selection(func):
+    """Decorator that passes a `Selection` built from the non-kwonly args."""
+    return _CallWithSelection(func)
+
+
+# Axes -> (formatting state, {(x, y): text}); see `_format_coords_unspaced`.
+_coord_text_caches = WeakKeyDictionary()
+_COORD_TEXT_CACHE_SIZE = 2 ** 12
+
+
+def _get_coord_format_state(ax):
+    """
+    Return the state on which the output of ``ax.format_coord`` depends: the
+    formatting functions, the units and converters of the axes, and the view
+    limits and size (as formatters may adapt their precision to them).
+
+    Changes to the internal state of formatters are not detected.
+    """
+    return (ax.format_coord, ax.fmt_xdata, ax.fmt_ydata,
+            *[(axis.major.formatter, axis.converter, axis.units)
+              for axis in [ax.xaxis, ax.yaxis]],
+            tuple(ax.viewLim.bounds), tuple(ax.bbox.bounds))
+
+
+def _unspace_coord_text(text):
     # Un-space-pad, remove empty coordinates from the output of
     # `format_{x,y}data`, and rejoin with newlines.
     return "\n".join(
         line for line, empty in zip(
-            re.split(",? +", ax.format_coord(*xy)),
+            re.split(",? +", text),
             itertools.chain(["x=", "y=", "z="], itertools.repeat(None)))
         if line != empty).rstrip()
 
 
+def _format_coords_unspaced_uncached(ax, xys):
+    """
+    Return the unspaced ``ax.format_coord`` texts of each point in *xys*.
+
+    If *ax* uses the default ``format_coord``, the x and y columns are
+    formatted separately, each distinct value only once.
+    """
+    from matplotlib.axes import Axes
+    if getattr(ax.format_coord, "__func__", None) is not Axes.format_coord:
+        return [_unspace_coord_text(ax.format_coord(*xy)) for xy in xys]
+    columns = []
+    for format_data, values in [(ax.format_xdata, xys[:, 0]),
+                                (ax.format_ydata, xys[:, 1])]:
+        values, inverse = np.unique(values, return_inverse=True)
+        texts = [*map(format_data, values.tolist())]
+        columns.append([texts[i] for i in inverse])
+    return [_unspace_coord_text(f"x={x} y={y}") for x, y in zip(*columns)]
+
+
+def _format_coord_unspaced(ax, xy):
+    return _format_coords_unspaced(ax, [xy])[0]
+
+
+def _format_coords_unspaced(ax, xys):
+    """
+    Vectorized, cached version of ``ax.format_coord`` (with the output
+    unspaced), returning a list of texts.
+
+    Texts are cached per axes for as long as the formatting state (see
+    `_get_coord_format_state`) is unchanged, so that repeatedly formatting the
+    same points (e.g. when hovering back and forth, or when exporting a hover
+    table after prefetching its texts) does not go again through unit
+    converters and tick formatters.  When a batch overflows the cache, the
+    cache is reset to the texts of that batch, so that a batch never evicts
+    its own texts.
+    """
+    state = _get_coord_format_state(ax)
+    cached_state, cache = _coord_text_caches.get(ax, (None, None))
+    if cache is None or cached_state != state:
+        cache = {}
+        _coord_text_caches[ax] = state, cache
+    xys = np.asarray(xys, float).reshape((-1, 2))
+    if len(xys) == 1:  # Fast path for hovering.
+        inverse = [0]
+    else:
+        xys, inverse = np.unique(xys, axis=0, return_inverse=True)
+    keys = [*map(tuple, xys.tolist())]
+    texts = [*map(cache.get, keys)]
+    missing = [i for i, text in enumerate(texts) if text is None]
+    if missing:
+        for i, text in zip(missing, _format_coords_unspaced_uncached(
+                ax, xys[missing])):
+            texts[i] = text
+        if len(cache) + len(missing) > _COORD_TEXT_CACHE_SIZE:
+            cache.clear()
+            cache.update(zip(keys, texts))  # Keep the whole batch.
+        else:
+            cache.update((keys[i], texts[i]) for i in missing)
+    return [texts[i] for i in inverse]
+
+
 @functools.singledispatch
 @_call_with_selection
 def get_ann_text(sel):
@@ -528,6 +1678,8 @@ def _strip_math(s):
 
 
 def _format_scalarmappable_value(artist, idx):  # matplotlib/matplotlib#12473.
+    from matplotlib.backend_bases import RendererBase
+    from matplotlib.figure import Figure
     data = artist.get_array()[idx]
     if np.ndim(data) == 0:
         if not artist.colorbar:
@@ -546,11 +1698,11 @@ def _format_scalarmappable_value(artist, idx):  # matplotlib/matplotlib#12473.
         return artist.format_cursor_data(data)  # Includes brackets.
 
 
-@get_ann_text.register(Line2D)
-@get_ann_text.register(LineCollection)
-@get_ann_text.register(PatchCollection)
-@get_ann_text.register(PathCollection)
-@get_ann_text.register(Patch)
+@_lazy_register(get_ann_text, "matplotlib.lines.Line2D")
+@_lazy_register(get_ann_text, "matplotlib.collections.LineCollection")
+@_lazy_register(get_ann_text, "matplotlib.collections.PatchCollection")
+@_lazy_register(get_ann_text, "matplotlib.collections.PathCollection")
+@_lazy_register(get_ann_text, "matplotlib.patches.Patch")
 @_call_with_selection
 def _(sel):
     artist = sel.artist
@@ -572,7 +1724,7 @@ def _(sel):
 _Event = namedtuple("_Event", "xdata ydata")
 
 
-@get_ann_text.register(AxesImage)
+@_lazy_register(get_ann_text, "matplotlib.image.AxesImage")
 @_call_with_selection
 def _(sel):
     artist = sel.artist
@@ -581,7 +1733,7 @@ def _(sel):
     return f"{text}\n{cursor_text}"
 
 
-@get_ann_text.register(Barbs)
+@_lazy_register(get_ann_text, "matplotlib.quiver.Barbs")
 @_call_with_selection
 def _(sel):
     artist = sel.artist
@@ -591,7 +1743,7 @@ def _(sel):
     return text
 
 
-@get_ann_text.register(Quiver)
+@_lazy_register(get_ann_text, "matplotlib.quiver.Quiver")
 @_call_with_selection
 def _(sel):
     artist = sel.artist
@@ -607,14 +1759,14 @@ def _(sel):
     return get_ann_text(*sel._replace(artist=sel.artist.container))
 
 
-@get_ann_text.register(BarContainer)
+@_lazy_register(get_ann_text, "matplotlib.container.BarContainer")
 @_call_with_selection
 def _(sel):
     return _format_coord_unspaced(
         _artist_in_container(sel.artist).axes, sel.target)
 
 
-@get_ann_text.register(ErrorbarContainer)
+@_lazy_register(get_ann_text, "matplotlib.container.ErrorbarContainer")
 @_call_with_selection
 def _(sel):
     data_line, cap_lines, err_lcs = sel.artist
@@ -647,7 +1799,7 @@ def _(sel):
     return ann_text
 
 
-@get_ann_text.register(StemContainer)
+@_lazy_register(get_ann_text, "matplotlib.container.StemContainer")
 @_call_with_selection
 def _(sel):
     return get_ann_text(*sel._replace(artist=sel.artist.markerline))
@@ -683,7 +1835,7 @@ def _move_within_points(sel, xys, *, key):
             return sel
 
 
-@move.register(Line2D)
+@_lazy_register(move, "matplotlib.lines.Line2D")
 @_call_with_selection
 def _(sel, *, key):
     data_xy = sel.artist.get_xydata()
@@ -694,7 +1846,7 @@ def _(sel, *, key):
         key=key)
 
 
-@move.register(PathCollection)
+@_lazy_register(move, "matplotlib.collections.PathCollection")
 @_call_with_selection
 def _(sel, *, key):
     if _is_scatter(sel.artist):
@@ -709,7 +1861,7 @@ def _(sel, *, key):
         return sel
 
 
-@move.register(AxesImage)
+@_lazy_register(move, "matplotlib.image.AxesImage")
 @_call_with_selection
 def _(sel, *, key):
     ns = sel.artist.get_array().shape[:2]
@@ -735,7 +1887,7 @@ def _(sel, *, key):
             ._replace(artist=sel.artist))
 
 
-@move.register(ErrorbarContainer)
+@_lazy_register(move, "matplotlib.container.ErrorbarContainer")
 @_call_with_selection
 def _(sel, *, key):
     data_line, cap_lines, err_lcs = sel.artist
@@ -761,7 +1913,7 @@ def _set_valid_props(artist, kwargs):
     return artist
 
 
-@make_highlight.register(Line2D)
+@_lazy_register(make_highlight, "matplotlib.lines.Line2D")
 @_call_with_selection
 def _(sel, *, highlight_kwargs):
     hl = copy.copy(sel.artist)
@@ -769,7 +1921,7 @@ def _(sel, *, highlight_kwargs):
     return hl
 
 
-@make_highlight.register(PathCollection)
+@_lazy_register(make_highlight, "matplotlib.collections.PathCollection")
 @_call_with_selection
 def _(sel, *, highlight_kwargs):
     hl = copy.copy(sel.artist)
@@ -778,3 +1930,11 @@ def _(sel, *, highlight_kwargs):
         np.arange(len(offsets))[:, None] == sel.target.index, offsets, np.nan))
     _set_valid_props(hl, highlight_kwargs)
     return hl
+
+
+for _generic in [compute_pick, _compute_picks, _get_hover_targets,
+                 get_ann_text, move, make_highlight]:
+    _hook_register_pending(_generic)
+if "matplotlib.axes" in sys.modules:
+    # No import time to save, but registering `scatter` early is better.
+    _register_pending()
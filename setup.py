@@ -27,25 +27,17 @@ def _pth_hook():
                             return
                         import functools
                         import json
-                        import weakref
-                        # Ensure that when the cursor is removed(), or gets
-                        # GC'd because its referents artists are GC'd, the
-                        # entry also disappears.
-                        cursors = weakref.WeakValueDictionary()
                         options = json.loads(os.environ["MPLCURSORS"])
-                        @functools.wraps(module.Figure.draw)
+                        @functools.wraps(module.Figure.__init__)
                         def wrapper(self, *args, **kwargs):
-                            rv = wrapper.__wrapped__(self, *args, **kwargs)
-                            if self not in cursors:
-                                cursor = mplcursors.cursor(self, **options)
-                                if cursor.artists:
-                                    cursors[self] = cursor
-                                else:
-                                    # No artist yet; skip possible
-                                    # initialization code.
-                                    cursor.remove()
-                            return rv
-                        module.Figure.draw = wrapper
+                            wrapper.__wrapped__(self, *args, **kwargs)
+                            # Create a cursor (which tracks further artists)
+                            # when the first artist is added, if the figure
+                            # is managed by pyplot; figure redraws are not
+                            # affected.
+                            mplcursors._mplcursors._attach_on_first_artist(
+                                self, **options)
+                        module.Figure.__init__ = wrapper
                     spec.loader.exec_module = exec_module
                     sys.meta_path.remove(self)
                 return spec
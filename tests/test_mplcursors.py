@@ -1,11 +1,18 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 import copy
+import datetime
 import functools
 import gc
+import json
 import os
 from pathlib import Path
 import re
 import subprocess
 import sys
+import threading
+import tracemalloc
+import types
 import weakref
 
 import matplotlib as mpl
@@ -103,6 +110,28 @@ def test_selection_identity_comparison():
     assert sel0 != sel1
 
 
+def test_call_with_selection():
+    @_pick_info._call_with_selection
+    def func(sel, *, key=None):
+        return sel, key
+
+    sel = Selection(artist=None, target=np.array([0, 0]), dist=0,
+                    annotation=None, extras=[])
+    # The signature is not inspected upon wrapping or on the fast path.
+    func(*sel, key="left")
+    assert func._kwonly_params is None
+    for args, kwargs in [
+            ([*sel], {}),
+            ([], sel._asdict()),
+            (sel[:2], {"dist": 0, "extras": []})]:
+        res, key = func(*args, **kwargs, key="left")
+        assert type(res) is Selection and key == "left"
+        assert res.artist is None and res.target is sel.target
+    res, key = func(*sel[:2])
+    assert res.dist is res.annotation is res.extras is key is None
+    pytest.raises(TypeError, func, *sel, foo=1)
+
+
 def test_degenerate_inputs(ax):
     empty_container = ax.bar([], [])
     assert not mplcursors.cursor().artists
@@ -163,6 +192,333 @@ def test_scatter_text(ax):
         cursor.selections[0], "x=(.*)\ny=(.*)\n\[(.*)\]") == (0, 0, 2)
 
 
+def test_scatter_classification(ax):
+    scatter = ax.scatter([0, 1], [0, 1])
+    assert _pick_info._is_scatter(scatter)
+    scatter.set_paths([mpl.path.Path.unit_circle()] * 2)
+    assert _pick_info._is_scatter(scatter)  # Marked by the scatter patch.
+    del scatter._mplcursors_scatter
+    assert not _pick_info._is_scatter(scatter)
+    nonscatter = ax.add_collection(mpl.collections.PathCollection(
+        [mpl.path.Path([(0, 0), (1, 1)])]))
+    assert not _pick_info._is_scatter(nonscatter)
+
+
+@pytest.mark.parametrize("plotter", [
+    lambda ax: ax.plot([0, .5, 1], [0, 1, .5], "o-")[0],
+    lambda ax: ax.plot([0, .5, 1], [0, 1, .5], drawstyle="steps-mid")[0],
+    lambda ax: ax.quiver([0, .5, 1], [0, 1, .5], 1, 1),
+    lambda ax: ax.scatter([0, .5, 1], [0, 1, .5]),
+    lambda ax: ax.bar([0, .5, 1], [0, 1, .5], .2),
+    lambda ax: ax.errorbar([0, .5, 1], [0, 1, .5], .2, .2),
+    lambda ax: ax.vlines([0, .5, 1], -.5, [0, 1, .5]),
+])
+def test_compute_picks(ax, plotter):
+    artist = plotter(ax)
+    ax.set(xlim=(-1, 2), ylim=(-1, 2))
+    rs = np.random.RandomState(0)
+    xys = (np.array([[0, 0], [.5, 1], [1, .5]])[rs.randint(3, size=200)]
+           + rs.normal(scale=.05, size=(200, 2)))
+    # Events coordinates are rounded to integers.
+    screen_xys = np.round(ax.transData.transform(xys))
+    picks = mplcursors.compute_picks(artist, screen_xys)
+    assert len(picks.index) == len(picks.target) == len(picks.dist) == 200
+    assert 0 < np.isnan(picks.dist).sum() < 200
+    np.testing.assert_array_equal(
+        mplcursors.compute_picks(artist, xys, coords="data").dist,
+        mplcursors.compute_picks(artist, ax.transData.transform(xys)).dist)
+    for xy, index, target, dist in zip(screen_xys, *picks):
+        sel = mplcursors.compute_pick(
+            artist, MouseEvent("", ax.figure.canvas, *xy))
+        if sel:
+            assert dist == sel.dist
+            assert target == approx(sel.target)
+            if isinstance(index, _pick_info.Index):
+                assert vars(index) == vars(sel.target.index)
+            else:
+                assert index == approx(sel.target.index)
+        else:
+            assert np.isnan(dist) and np.isnan(target).all()
+            assert index is None or np.isnan(index)
+
+
+def test_export_hover_table(ax, tmp_path):
+    ax.plot([0, 1, 2], [0, 1, .5], "o", label="line")
+    ax.scatter([0, 1, 2], [1, 0, 1.5])
+    ax.errorbar([0, 1, 2], [2, 1.5, 1], [.1, .2, .1], fmt="s")
+    image = ax.imshow([[0, 1], [2, 3]], extent=(3, 4, 3, 4))  # Not exported.
+    ax.set(xlim=(-1, 3), ylim=(-1, 3))
+    cursor = mplcursors.cursor()
+    exported = [artist for artist in cursor.artists if artist is not image]
+    table = cursor.export_hover_table(tmp_path / "table.json")
+    assert json.loads((tmp_path / "table.json").read_text()) == table
+    entries = table["artists"]
+    assert len(entries) == 3
+    for artist, entry in zip(exported, entries):
+        assert entry["figure"] == 0
+        assert entry["axes_bbox"] == [*ax.bbox.extents]
+        assert entry["index"] == [0, 1, 2]
+        for xy, index, text in zip(entry["xy"], entry["index"], entry["text"]):
+            sel = mplcursors.compute_pick(
+                artist, MouseEvent("", ax.figure.canvas, *np.round(xy)))
+            assert sel.target.index == index
+            assert _pick_info.get_ann_text(*sel) == text
+    assert entries[exported.index(ax.lines[0])]["text"][0].startswith(
+        "line\nx=0")
+
+    figs = []
+    cursor.connect("view_change", figs.append)
+    ax.set(xlim=(.5, 3))
+    assert figs == [ax.figure]
+    assert [entry["index"] for entry in cursor.export_hover_table()[
+        "artists"]] == [[1, 2]] * 3
+    cursor.remove()
+    ax.set(xlim=(-1, 3))
+    assert figs == [ax.figure]
+
+
+def test_export_hover_table_formats_once(ax, monkeypatch):
+    monkeypatch.setattr(_pick_info, "_COORD_TEXT_CACHE_SIZE", 100)
+    x = np.linspace(0, 1, 1000)
+    ax.plot(x, np.zeros_like(x), "o")
+    calls = []
+    ax.fmt_xdata = lambda x: calls.append(x) or f"{x:.4f}"
+    table = mplcursors.cursor().export_hover_table()
+    assert len(table["artists"][0]["text"]) == 1000
+    assert len(calls) == 1000  # Once per point, despite the small cache.
+
+
+def test_format_coords_cache(ax):
+    t = mpl.dates.drange(datetime.datetime(2014, 1, 15),
+                         datetime.datetime(2014, 2, 27),
+                         datetime.timedelta(hours=2))
+    ax.plot_date(t, np.sin(t), "-")
+    ax.xaxis.set_major_formatter(mpl.dates.DateFormatter("%Y-%m-%d"))
+    calls = []
+    format_coord = ax.format_coord
+    ax.format_coord = lambda x, y: calls.append((x, y)) or format_coord(x, y)
+    xys = [(t[0], 0.), (t[10], .5), (t[0], 0.)]
+    texts = _pick_info._format_coords_unspaced(ax, xys)
+    assert texts == [_pick_info._unspace_coord_text(format_coord(*xy))
+                     for xy in xys]
+    assert texts[0].startswith("x=2014-01-15")
+    assert len(calls) == 2
+    assert _pick_info._format_coord_unspaced(ax, xys[1]) == texts[1]
+    assert len(calls) == 2
+    ax.set_xlim(t[0], t[20])  # Invalidates the cache.
+    _pick_info._format_coords_unspaced(ax, xys)
+    assert len(calls) == 4
+    ax.xaxis.set_major_formatter(mpl.dates.DateFormatter("%d/%m"))
+    assert _pick_info._format_coord_unspaced(ax, xys[0]).startswith(
+        "x=15/01")
+
+
+def test_format_coords_columns(ax, monkeypatch):
+    ax.plot([0, 1])
+    calls = []
+    ax.fmt_xdata = lambda x: calls.append(x) or f"{x:.2f}"
+    ax.fmt_ydata = lambda y: calls.append(y) or f"{y:.3f}"
+    xys = [(0, 0), (0, 1), (1, 1), (0, 0)]
+    # Each distinct value of each column is formatted once.
+    texts = _pick_info._format_coords_unspaced(ax, xys)
+    assert len(calls) == 2 + 2
+    assert texts == [
+        _pick_info._unspace_coord_text(ax.format_coord(*xy)) for xy in xys]
+    # A batch larger than the cache does not evict its own texts.
+    monkeypatch.setattr(_pick_info, "_COORD_TEXT_CACHE_SIZE", 4)
+    del calls[:]
+    xys = [(i, i) for i in range(10)]
+    texts = _pick_info._format_coords_unspaced(ax, xys)
+    assert [*map(_pick_info._format_coord_unspaced, [ax] * 10, xys)] == texts
+    assert len(calls) == 2 * 8  # (0, 0) and (1, 1) were already cached.
+
+
+def test_inverted_transform_cache(ax):
+    ax.plot([1, 2, 3])
+    ax.figure.canvas.draw()
+    xys = [[100, 100], [200, 300]]
+
+    def check():
+        inv = _pick_info._get_inverted_transform(ax.transData)
+        assert _pick_info._get_inverted_transform(ax.transData) is inv
+        np.testing.assert_allclose(
+            inv.transform(xys), ax.transData.inverted().transform(xys))
+
+    check()
+    ax.set_xlim(0, 10)
+    check()
+    ax.figure.set_size_inches(3, 2)
+    check()
+    ax.set_yscale("log")
+    check()
+    ax.set_position([.2, .2, .5, .5])
+    check()
+
+
+@pytest.mark.parametrize("projection", ["log", "polar"])
+def test_projection_picks_cache(fig, projection):
+    if projection == "log":
+        ax = fig.add_subplot(xscale="log", yscale="log")
+        line, = ax.plot(np.logspace(0, 2, 50), np.logspace(1, 3, 50))
+    else:
+        ax = fig.add_subplot(projection="polar")
+        line, = ax.plot(np.linspace(0, np.pi, 50), np.linspace(1, 2, 50))
+    xys = np.array([[200, 200], [300, 250], [350, 300]], float)
+
+    def check():
+        fig.canvas.draw()
+        cached = _pick_info._compute_projection_picks(
+            line, line.get_path(), xys, cache=True)
+        uncached = _pick_info._compute_projection_picks(
+            line, line.get_path(), xys)
+        for c, u in zip(cached, uncached):
+            np.testing.assert_allclose(c, u)
+        return line._mplcursors_polyline_cache
+
+    cache = check()
+    assert check() is cache
+    assert cache._value is not None and not cache._invalid
+    if projection == "log":
+        ax.set_xlim(10, 1000)
+    else:
+        ax.set_rlim(0, 5)
+    assert check() is cache
+    line.set_data([1, 2, 3], [4, 5, 6])
+    assert check() is not cache
+
+
+def test_projection_scratch(ax):
+    x = np.linspace(0, 10, 10 ** 6)
+    line, = ax.plot(x, np.sin(x))
+    line.set_pickradius(np.inf)
+    xys = ax.transData.transform([[1, .5], [5, 0], [np.nan, 0]])
+    picks = _pick_info._compute_projection_picks(
+        line, line.get_path(), xys, cache=True)
+    scratch = line._mplcursors_polyline_cache.scratch
+    buffers = scratch._buffers
+    # Reusing the scratch buffers gives bit-identical results, without
+    # reallocation.
+    for c, u in zip(_pick_info._compute_projection_picks(
+                        line, line.get_path(), xys[:2], cache=True),
+                    _pick_info._compute_projection_picks(
+                        line, line.get_path(), xys[:2])):
+        np.testing.assert_array_equal(c, u)
+    assert scratch._buffers is buffers
+    for c, u in zip(_pick_info._compute_projection_picks(
+                        line, line.get_path(), xys, cache=True), picks):
+        np.testing.assert_array_equal(c, u)
+    assert np.isnan(picks[2][2])
+    # No per-vertex allocations once the scratch buffers exist.
+    tracemalloc.start()
+    try:
+        _pick_info._compute_projection_picks(
+            line, line.get_path(), xys, cache=True)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert peak < x.nbytes / 8  # Only ufunc buffers, of bounded size.
+    # float32 screen coordinates, opted in per call.  Segments are much
+    # shorter than a pixel, so only compare the targets and the distances.
+    picks32 = mplcursors.compute_picks(line, xys, screen_dtype=np.float32)
+    assert line._mplcursors_polyline_cache.dtype == np.float32
+    for c, u in zip(picks32[1:], picks[1:]):
+        np.testing.assert_allclose(c, u, atol=1e-3)
+    # The float64 default remains bit-identical.
+    for c, u in zip(mplcursors.compute_picks(line, xys), picks):
+        np.testing.assert_array_equal(c, u)
+    assert line._mplcursors_polyline_cache.dtype == np.float64
+    with pytest.raises(ValueError):
+        mplcursors.compute_picks(line, xys, screen_dtype=int)
+
+
+def test_screen_dtype(ax):
+    ax.plot([0, 1, 2], [0, 1, 0])
+    cursor = mplcursors.cursor(screen_dtype="float32")
+    _process_event("__mouse_click__", ax, (.5, .5), 1)
+    assert cursor.selections[0].target == approx((.5, .5))
+    assert ax.lines[0]._mplcursors_polyline_cache.dtype == np.float32
+    with pytest.raises(ValueError):
+        mplcursors.cursor(screen_dtype=np.float16)
+
+
+@pytest.mark.parametrize("drawstyle", ["steps-pre", "steps-mid", "steps-post"])
+@pytest.mark.parametrize("scale", ["linear", "log"])
+@pytest.mark.parametrize("order", ["sorted", "reversed", "shuffled"])
+def test_steps_picks(ax, drawstyle, scale, order):
+    rs = np.random.RandomState(0)
+    x = {"sorted": np.arange(1, 51),
+         "reversed": np.arange(50, 0, -1),
+         "shuffled": rs.permutation(50) + 1}[order].astype(float)
+    y = rs.uniform(1, 10, 50)
+    y[10] = np.nan
+    ax.set(xscale=scale, yscale=scale)
+    line, = ax.plot(x, y, drawstyle=drawstyle)
+    ax.figure.canvas.draw()
+    xys = np.concatenate([
+        rs.uniform(0, 500, (100, 2)),
+        ax.transData.transform(np.column_stack([x, y]))[:20]])
+    # Same results as projecting on the path of the step plot.
+    for s, p in zip(_pick_info._compute_steps_picks(line, xys),
+                    _pick_info._compute_projection_picks(
+                        line, line.get_path(), xys)):
+        np.testing.assert_array_equal(s, p)
+
+
+@pytest.mark.parametrize("drawstyle", ["steps-pre", "steps-mid", "steps-post"])
+@pytest.mark.parametrize("step", [1, -1])
+def test_steps_picks_blocks(ax, monkeypatch, drawstyle, step):
+    # Dense noisy lines, picked far from the line, check many blocks of
+    # segments (which are also split across several chunks).
+    monkeypatch.setattr(_pick_info, "_STEPS_BLOCK_SIZE", 8)
+    monkeypatch.setattr(_pick_info, "_CHUNK_SIZE", 64)
+    rs = np.random.RandomState(0)
+    x = np.linspace(0, 10, 2000)[::step]
+    line, = ax.plot(x, np.sin(x) + rs.normal(0, .1, 2000),
+                    drawstyle=drawstyle)
+    ax.figure.canvas.draw()
+    xys = ax.transData.transform(
+        np.column_stack([rs.uniform(-1, 11, 200), rs.uniform(-3, 3, 200)]))
+    for s, p in zip(_pick_info._compute_steps_picks(line, xys),
+                    _pick_info._compute_projection_picks(
+                        line, line.get_path(), xys)):
+        np.testing.assert_array_equal(s, p)
+
+
+@pytest.mark.parametrize("plotter", ["errorbar", "stem", "vlines"])
+def test_segments_picks(ax, monkeypatch, plotter):
+    x = np.arange(1, 21)
+    y = np.random.RandomState(0).uniform(1, 10, 20)
+    y[5] = np.nan  # Unpickable segment, which must not shift indices.
+    if plotter == "errorbar":
+        artist = ax.errorbar(x, y, 1, .5)
+    elif plotter == "stem":
+        with pytest.warns(None):  # stem use_line_collection API change.
+            artist = ax.stem(x, y, use_line_collection=True)
+    else:
+        artist = ax.vlines(x, 0, y)
+    ax.figure.canvas.draw()
+    events = [
+        MouseEvent("", ax.figure.canvas, *xy) for xy in
+        np.round(ax.transData.transform(
+            np.column_stack([x, .9 * np.nan_to_num(y, nan=1)])))]
+    sels = [mplcursors.compute_pick(artist, event) for event in events]
+    assert sum(map(bool, sels)) >= 15
+    for sel in filter(None, sels):
+        idx = sel.target.index
+        assert (idx[0] if isinstance(idx, tuple) else idx) + 1 \
+            == approx(sel.target[0])
+    # Same as picking the segments one at a time.
+    monkeypatch.setattr(
+        _pick_info, "_compute_segments_picks", lambda *args: None)
+    for event, sel in zip(events, sels):
+        ref = mplcursors.compute_pick(artist, event)
+        assert bool(sel) == bool(ref)
+        if sel:
+            assert sel.target.index == ref.target.index
+            assert sel.dist == ref.dist
+            np.testing.assert_array_equal(sel.target, ref.target)
+
+
 def test_steps_index():
     index = _pick_info.Index(0, .5, .5)
     assert np.floor(index) == 0 and np.ceil(index) == 1
@@ -506,6 +862,361 @@ def test_callback(ax):
     assert len(calls) == 1
 
 
+def test_bind_labels(ax):
+    scatter = ax.scatter([0, 1, 2], [0, 1, 2])
+    line, = ax.plot([0, 1, 2], [2, 2.5, 3])
+    bars = ax.bar([3, 4], [1, 2])
+    cursor = mplcursors.cursor()
+    cursor.bind_labels(scatter, ["a", "b", "c"])
+    calls = []
+
+    def formatter(indices):
+        calls.append(indices)
+        return [f"#{idx}" for idx in indices]
+
+    cursor.bind_labels(line, formatter)
+    cursor.bind_labels(bars, np.array([10, 20]))
+    for xy, text in [((1, 1), "b"), ((0, 2), "#0"), ((.6, 2.3), "#1"),
+                     ((1.4, 2.7), "#1"), ((4, 1), "20")]:
+        _process_event("__mouse_click__", ax, xy, 1)
+        assert cursor.selections[0].annotation.get_text() == text
+    assert len(calls) == 1 and calls[0].tolist() == [0, 1, 2]
+    cursor.bind_labels(scatter, None)
+    _process_event("__mouse_click__", ax, (2, 2), 1)
+    assert cursor.selections[0].annotation.get_text() == "x=2.000\ny=2.000"
+    with pytest.raises(ValueError):
+        cursor.bind_labels(ax.bar([5], [1]), ["d"])
+
+
+def test_bind_labels_tuple_index(ax):
+    lc = ax.add_collection(mpl.collections.LineCollection(
+        [[(0, 0), (1, 1), (2, 0)], [(0, 2), (2, 2)]]))
+    image = ax.imshow([[0, 1], [2, 3]], extent=(3, 5, 0, 2))
+    ax.set(xlim=(-1, 6), ylim=(-1, 3))
+    cursor = mplcursors.cursor()
+    cursor.bind_labels(lc, ["first", "second"])
+    cursor.bind_labels(image, np.array([["a", "b"], ["c", "d"]]))
+    for xy, text in [((.5, .5), "first"), ((1.6, .4), "first"),
+                     ((1.5, 2), "second"), ((3.5, 1.5), "a"),
+                     ((4.5, .5), "d")]:
+        _process_event("__mouse_click__", ax, xy, 1)
+        assert cursor.selections[0].annotation.get_text() == text
+    calls = []
+
+    def formatter(indices):
+        calls.append(indices)
+        return [f"#{seg}.{vertex}" for seg, vertex in indices]
+
+    cursor.bind_labels(lc, formatter)
+    for xy, text in [((.5, .5), "#0.0"), ((1.6, .4), "#0.2"),
+                     ((1.5, 2), "#1.1")]:
+        _process_event("__mouse_click__", ax, xy, 1)
+        assert cursor.selections[0].annotation.get_text() == text
+    assert [call.shape for call in calls] == [(1, 2)] * 3
+
+
+@pytest.mark.parametrize("label_mode", [*mplcursors.LabelMode])
+def test_deferred_callback(ax, label_mode):
+    ax.plot([0, 1, 2])
+    cursor = mplcursors.cursor(label_mode=label_mode)
+    gate = threading.Event()
+    calls = []
+
+    def on_add(sel):
+        calls.append(sel)
+        return f"deferred {sel.target[0]:.1f}"
+
+    with ThreadPoolExecutor(1) as executor:
+        assert cursor.connect("add", on_add, executor=executor) is on_add
+        executor.submit(gate.wait)  # Queue the callbacks behind this task.
+        try:
+            _process_event("__mouse_click__", ax, (.5, .5), 1)
+            _process_event("__mouse_click__", ax, (1, 1), 1)
+            _process_event("__mouse_click__", ax, (1.5, 1.5), 1)
+            sel, = cursor.selections
+            if sel.annotation:
+                assert sel.annotation.get_text().startswith("x=1.")
+        finally:
+            gate.set()
+    # Superseded selections had their callbacks cancelled.
+    assert [other.target[0] for other in calls] == approx([1.5])
+    cursor._deferred_timer._on_timer()
+    if sel.annotation:
+        assert sel.annotation.get_text() == "deferred 1.5"
+    elif label_mode == mplcursors.LabelMode.Batched:
+        layer, = cursor._label_layers.values()
+        assert layer._labels[id(sel)][1] == "deferred 1.5"
+    assert not cursor._deferred_futures
+    cursor.disconnect("add", on_add)
+    with pytest.raises(ValueError):
+        cursor.connect("remove", on_add, executor=ThreadPoolExecutor(1))
+
+
+@pytest.mark.parametrize("overflow, expected", [
+    ("drop-oldest", [1, 1.5]),
+    ("coalesce", [.5, 1.5]),
+])
+def test_stream(ax, overflow, expected):
+    ax.plot([0, 1, 2])
+    cursor = mplcursors.cursor()
+
+    async def main():
+        stream = cursor.stream(maxsize=2, overflow=overflow)
+        removed = cursor.stream("remove")
+        for x in [.5, 1, 1.5]:
+            _process_event("__mouse_click__", ax, (x, x), 1)
+        await asyncio.sleep(0)  # Let the selections be queued.
+        assert [sel.target[0] async for sel in _take(stream, 2)] == approx(
+            expected)
+        cursor.remove()
+        assert [sel async for sel in stream] == []
+        assert len([sel async for sel in removed]) == 3
+
+    asyncio.run(main())
+    with pytest.raises(RuntimeError):
+        cursor.stream()  # No running event loop.
+
+
+def test_stream_exit(ax):
+    ax.plot([0, 1, 2])
+    cursor = mplcursors.cursor()
+    on_add = []
+    cursor.connect("add", on_add.append)
+
+    async def main():
+        stream = cursor.stream()
+        _process_event("__mouse_click__", ax, (.5, .5), 1)
+        async for sel in stream:
+            break
+        for _ in range(3):  # Let the generator be finalized.
+            await asyncio.sleep(0)
+        assert stream not in cursor._streams
+        return cursor.stream()
+
+    loop = asyncio.new_event_loop()
+    stream = loop.run_until_complete(main())
+    loop.close()
+    _process_event("__mouse_click__", ax, (1, 1), 1)
+    # The stream is dropped, without skipping the other callbacks.
+    assert len(on_add) == 2
+    assert stream not in cursor._streams
+    stream.close()
+
+
+async def _take(aiter, n):
+    for _ in range(n):
+        yield await aiter.__anext__()
+
+
+def test_lazy_text(ax, monkeypatch):
+    ax.plot([0, 1])
+    cursor = mplcursors.cursor()
+    calls = []
+    get_ann_text = _pick_info.get_ann_text
+    monkeypatch.setattr(
+        _pick_info, "get_ann_text",
+        lambda *args: calls.append(args) or get_ann_text(*args))
+    on_add = cursor.connect("add", lambda sel: sel.annotation.set_text("foo"))
+    _process_event("__mouse_click__", ax, (.5, .5), 1)
+    assert cursor.selections[0].annotation.get_text() == "foo"
+    assert not calls
+    cursor.disconnect("add", on_add)
+    on_add = cursor.connect("add", lambda sel: sel.annotation.set_text(
+        sel.annotation.get_text() + "\nfoo"))
+    _process_event("__mouse_click__", ax, (.4, .4), 1)
+    assert re.fullmatch(r"x=0\.\d+\ny=0\.\d+\nfoo",
+                        cursor.selections[0].annotation.get_text())
+    assert len(calls) == 1
+    cursor.disconnect("add", on_add)
+    _process_event("__mouse_click__", ax, (.3, .3), 1)
+    ann = cursor.selections[0].annotation
+    assert re.fullmatch(r"x=0\.\d+\ny=0\.\d+", ann.get_text())
+    assert len(calls) == 2
+    assert "get_text" not in vars(ann)
+
+
+def test_batch_selections(ax, monkeypatch):
+    ax.plot([0, 1, 2])
+    cursor = mplcursors.cursor(multiple=True)
+    _process_event("__mouse_click__", ax, (.5, .5), 1)
+    sel, = cursor.selections
+    cursor.remove_selection(sel)
+    ax.figure.canvas.draw()
+    removed = []
+    cursor.connect("remove", removed.append)
+    draws = []
+    monkeypatch.setattr(ax.figure.canvas, "draw_idle",
+                        lambda: draws.append(None))
+    pis = [sel._replace(target=_pick_info._with_attrs([x, x], index=x))
+           for x in [.5, 1, 1.5]]
+    sels = cursor.add_selections(pis)
+    assert len(draws) == 1
+    assert cursor.selections == tuple(sels)
+    assert len(ax.texts) == 3
+    cursor.remove_selections(sels[:2])
+    assert len(draws) == 2
+    assert cursor.selections == tuple(sels[2:])
+    cursor.clear()
+    assert len(draws) == 3
+    assert removed == sels
+    assert len(ax.texts) == 0
+
+
+def test_batched_labels(ax):
+    ax.plot([0, 1, 2], "o-")
+    cursor = mplcursors.cursor(
+        multiple=True, label_mode=mplcursors.LabelMode.Batched)
+    for x in [0, 1, 2]:
+        _process_event("__mouse_click__", ax, (x, x), 1)
+    assert len(cursor.selections) == 3
+    assert all(sel.annotation is None for sel in cursor.selections)
+    assert len(ax.texts) == 0
+    layer, = ax.artists
+    assert len(layer) == 3
+    ax.figure.canvas.draw()
+    x0, y0, x1, y1 = layer._drawn_extents[0]
+    center = ax.transData.inverted().transform(((x0 + x1) / 2, (y0 + y1) / 2))
+    # Right-clicking on a label removes it.
+    _process_event("__mouse_click__", ax, center, 3)
+    assert len(cursor.selections) == len(layer) == 2
+    # Clicking on a label converts it to a regular annotation.
+    ax.figure.canvas.draw()
+    x0, y0, x1, y1 = layer._drawn_extents[-1]
+    center = ax.transData.inverted().transform(((x0 + x1) / 2, (y0 + y1) / 2))
+    _process_event("__mouse_click__", ax, center, 1)
+    assert len(cursor.selections) == 2
+    assert cursor.selections[0].annotation is None
+    assert cursor.selections[1].annotation is ax.texts[0]
+    assert len(layer) == 1
+    # Toggling visibility.
+    _process_event("key_press_event", ax, (.123, .456), "v")
+    assert not layer.get_visible()
+    cursor.clear()
+    assert len(layer) == len(ax.texts) == 0
+
+
+def test_promoted_label_removal(ax):
+    ax.plot([0, 1, 2], "o-")
+    cursor = mplcursors.cursor(
+        multiple=True, label_mode=mplcursors.LabelMode.Batched)
+    for x in [0, 1]:
+        _process_event("__mouse_click__", ax, (x, x), 1)
+    sels = cursor.selections
+    layer, = ax.artists
+    for sel in sels:
+        ax.figure.canvas.draw()
+        idx = layer._drawn_ids.index(id(sel))
+        x0, y0, x1, y1 = layer._drawn_extents[idx]
+        center = ax.transData.inverted().transform(
+            ((x0 + x1) / 2, (y0 + y1) / 2))
+        _process_event("__mouse_click__", ax, center, 1)
+    assert len(ax.texts) == 2
+    promoted = cursor.selections
+    assert promoted[0] is not sels[0] and promoted[0].annotation is not None
+    # Both the pre-promotion and the promoted selections can be removed.
+    cursor.remove_selection(sels[0])
+    assert cursor.selections == (promoted[1],)
+    cursor.remove_selection(promoted[1])
+    assert not cursor.selections and not ax.texts and not cursor._promoted
+    with pytest.raises(ValueError):
+        cursor.remove_selection(sels[1])
+
+
+def test_promoted_deferred_label(ax):
+    ax.plot([0, 1, 2], "o-")
+    cursor = mplcursors.cursor(label_mode=mplcursors.LabelMode.Batched)
+    gate = threading.Event()
+    with ThreadPoolExecutor(1) as executor:
+        cursor.connect("add", lambda sel: "deferred", executor=executor)
+        executor.submit(gate.wait)  # Resolve only after the promotion.
+        try:
+            _process_event("__mouse_click__", ax, (1, 1), 1)
+            sel, = cursor.selections
+            layer, = ax.artists
+            ax.figure.canvas.draw()
+            x0, y0, x1, y1 = layer._drawn_extents[
+                layer._drawn_ids.index(id(sel))]
+            center = ax.transData.inverted().transform(
+                ((x0 + x1) / 2, (y0 + y1) / 2))
+            _process_event("__mouse_click__", ax, center, 1)
+        finally:
+            gate.set()
+    promoted, = cursor.selections
+    assert promoted.annotation is not None
+    cursor._deferred_timer._on_timer()
+    assert promoted.annotation.get_text() == "deferred"
+    assert not layer._labels and not cursor._deferred_futures
+
+
+def test_headless(ax, monkeypatch):
+    ax.plot([0, 1])
+    ax.figure.canvas.draw()
+    cursor = mplcursors.cursor(
+        hover=HoverMode.Transient, highlight=True,
+        label_mode=mplcursors.LabelMode.Headless)
+    calls = []
+    cursor.connect("add", lambda sel: calls.append(("add", sel)))
+    cursor.connect("remove", lambda sel: calls.append(("remove", sel)))
+    messages = []
+    monkeypatch.setattr(ax.figure.canvas, "toolbar",
+                        types.SimpleNamespace(set_message=messages.append),
+                        raising=False)
+    monkeypatch.setattr(ax.figure.canvas, "draw",
+                        lambda: pytest.fail("Unexpected draw"))
+    monkeypatch.setattr(ax.figure.canvas, "draw_idle",
+                        lambda: pytest.fail("Unexpected draw"))
+    _process_event("motion_notify_event", ax, (.5, .5))
+    sel, = cursor.selections
+    assert sel.annotation is None and sel.extras == []
+    assert len(ax.texts) == len(ax.artists) == 0
+    assert sel.target == approx((.5, .5))
+    assert re.fullmatch("x=(.*); y=(.*)", messages[-1])
+    _process_event("motion_notify_event", ax, (.6, .6))
+    _process_event("motion_notify_event", ax, (.5, 1))
+    assert len(cursor.selections) == 0
+    assert [name for name, _ in calls] == ["add", "add", "remove", "remove"]
+
+
+def test_stats(ax):
+    line, = ax.plot([0, 1])
+    scatter = ax.scatter([0, 1], [1, 0])
+    cursor = mplcursors.cursor()
+    _process_event("__mouse_click__", ax, (.5, .5), 1)
+    assert cursor.stats is None
+    cursor.stats = stats = mplcursors.CursorStats()
+    _process_event("__mouse_click__", ax, (.25, .25), 1)
+    _process_event(*_get_remove_args(cursor.selections[0]))
+    summary = stats.summary()
+    assert {*summary} == {
+        "event", "pick", "text", "position", "draw", "add", "remove"}
+    assert summary["pick"]["count"] == 2
+    assert summary["add"]["count"] == 1
+    assert summary["remove"]["count"] == 2  # Replaced, then deselected.
+    assert summary["event"]["max"] >= summary["add"]["max"]
+    assert {key for key, _ in stats.slowest("pick")} == {line, scatter}
+    assert {*stats.summary(by_key=True)} >= {("pick", line), ("text", line)}
+    stats.reset()
+    assert stats.summary() == {}
+
+
+def test_stats_bounded(ax):
+    stats = mplcursors.CursorStats(max_samples=10)
+    line, = ax.plot([0, 1])
+    for i in range(100):
+        stats.record("pick", line, i)
+    stats.record("pick", ax.plot([0, 1])[0], 1000)
+    assert len(stats._durations["pick", weakref.ref(line)].samples) == 10
+    summary = stats.summary(by_key=True)["pick", line]
+    assert (summary["count"], summary["total"], summary["max"]) == (
+        100, 4950, 99)
+    assert summary["p50"] == approx(94.5)  # Over the 10 last samples.
+    assert stats.slowest()[0][1] == 4950
+    ax.cla()
+    del line
+    gc.collect()
+    assert not stats._durations
+
+
 def test_remove_while_adding(ax):
     ax.plot([0, 1])
     cursor = mplcursors.cursor()
@@ -521,6 +1232,18 @@ def test_no_duplicate(ax):
     assert len(cursor.selections) == 1
 
 
+def test_remove_unknown_selection(ax):
+    ax.plot([0, 1])
+    cursor = mplcursors.cursor()
+    _process_event("__mouse_click__", ax, (.5, .5), 1)
+    sel, = cursor.selections
+    cursor.remove_selection(sel)
+    pytest.raises(ValueError, cursor.remove_selection, sel)
+    # The selection's point can be picked again.
+    _process_event("__mouse_click__", ax, (.5, .5), 1)
+    assert len(cursor.selections) == 1
+
+
 def test_remove_multiple_overlapping(ax):
     ax.plot([0, 1])
     cursor = mplcursors.cursor(multiple=True)
@@ -574,6 +1297,22 @@ def test_removed_artist(ax):
     assert len(cursor.selections) == len(ax.texts) == 0
 
 
+def test_cleared_axes(ax):
+    ax.plot([0, 1])
+    cursor = mplcursors.cursor()
+    assert len(cursor.artists) == 1
+    ax.cla()
+    assert len(cursor.artists) == 0
+    ax.plot([0, 1])
+    _process_event("__mouse_click__", ax, (.5, .5), 1)
+    assert len(cursor.selections) == len(ax.texts) == 0
+    # Clearing other axes does not affect the cursor.
+    l, = ax.plot([0, 1])
+    cursor = mplcursors.cursor(l)
+    ax.figure.add_subplot(212).clear()
+    assert cursor.artists == (l,)
+
+
 def test_remove_cursor(ax):
     ax.plot([0, 1])
     cursor = mplcursors.cursor()
@@ -670,6 +1409,120 @@ def test_gc(ax):
     assert not f_cursor.alive
 
 
+@pytest.mark.parametrize("plotter,kwargs", [
+    (lambda ax: ax.plot(np.arange(1000), "o-")[0], {"hover": True}),
+    (lambda ax: ax.plot(np.arange(1000), "o-")[0], {"highlight": True}),
+    (lambda ax: ax.scatter(*np.random.rand(2, 1000), c=np.arange(1000)), {}),
+])
+def test_memory_bounded(ax, plotter, kwargs):
+    # Repeated select/deselect cycles should not retain memory (highlight
+    # copies, colorbars used for formatting, annotations...).
+    artist = plotter(ax)
+    cursor = mplcursors.cursor(artist, **kwargs)
+    ax.figure.canvas.draw()
+    offsets = (artist.get_xydata() if hasattr(artist, "get_xydata")
+               else artist.get_offsets())
+    event_name = ("motion_notify_event" if kwargs.get("hover")
+                  else "__mouse_click__")
+
+    def cycle():
+        for xy in offsets[[100, 200]]:
+            _process_event(event_name, ax, xy, 1)
+        cursor.clear()
+
+    tracemalloc.start()
+    try:
+        for _ in range(5):  # Warmup, populating Matplotlib's caches.
+            cycle()
+        gc.collect()
+        baseline, _ = tracemalloc.get_traced_memory()
+        for _ in range(30):
+            cycle()
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    # Leaking a single annotation (with its transforms) per cycle would
+    # retain more than this.
+    assert current - baseline < 2 ** 17
+
+
+def test_track(fig):
+    ax = fig.add_subplot()
+    mplcursors.cursor([fig, ax], track=True)  # Kept alive by fig and ax.
+    gc.collect()
+    line, = ax.plot([0, 1], [0, 1])
+    cursor, = mplcursors.Cursor._keep_alive[line]
+    container = ax.errorbar([2, 3], [1, 1], .1)
+    ax2 = fig.add_subplot(212)
+    line2, = ax2.plot([0, 1])
+    assert cursor.artists == (
+        line, cursor._get_container_artist(container), line2)
+    _process_event("__mouse_click__", ax, (.5, .5), 1)
+    assert cursor.selections[0].artist is line
+    cursor.remove()
+    ax.plot([0, 1])
+    assert len(cursor.artists) == 3
+
+
+def test_track_clear(fig):
+    ax = fig.add_subplot()
+    cursor = mplcursors.cursor(fig, track=True)
+    kept = []  # Cleared but still referenced artists.
+    for _ in range(50):
+        kept.append(ax.plot([0, 1])[0])
+        ax.errorbar([0, 1], [0, 1], .1)
+        ax.cla()
+        gc.collect()
+        cursor.artists
+        assert len(cursor._artists) <= 2
+    line, = ax.plot([0, 1])
+    assert cursor.artists == (line,)
+
+
+def test_attach_on_first_artist(fig):
+    mplcursors._mplcursors._attach_on_first_artist(fig, multiple=True)
+    ax = fig.add_subplot()
+    line, = ax.plot([0, 1], [0, 1])
+    cursor, = mplcursors.Cursor._keep_alive[line]
+    container = ax.bar([2, 3], [1, 1])
+    assert cursor.artists == (line, cursor._get_container_artist(container))
+    ax.set(xlim=(-1, 4), ylim=(-1, 2))
+    _process_event("__mouse_click__", ax, (.5, .5), 1)
+    _process_event("__mouse_click__", ax, (2, .5), 1)
+    assert [sel.artist for sel in cursor.selections] == [line, container]
+    line.remove()
+    line2, = ax.plot([0, 1], [1, 0])  # Does not create another cursor.
+    assert cursor.artists == (cursor._get_container_artist(container), line2)
+
+
+def test_attach_on_first_artist_unmanaged():
+    fig = mpl.figure.Figure()  # Not managed by pyplot.
+    mplcursors._mplcursors._attach_on_first_artist(fig)
+    line, = fig.add_subplot().plot([0, 1])
+    assert line not in mplcursors.Cursor._keep_alive
+    registry = mplcursors._mplcursors._artist_added_registries[fig]
+    assert not registry.callbacks.get("artist_added")  # Disconnected.
+
+
+def test_lazy_import():
+    # Importing mplcursors does not import matplotlib.axes; implementations
+    # are registered on first dispatch.
+    subprocess.check_call([sys.executable, "-c", """\
+import sys
+import mplcursors
+assert "matplotlib.axes" not in sys.modules
+from matplotlib.backend_bases import MouseEvent
+from matplotlib.figure import Figure
+ax = Figure().add_subplot()
+line, = ax.plot([0, 1])
+event = MouseEvent("", ax.figure.canvas, *ax.transData.transform((.5, .5)))
+sel = mplcursors.compute_pick(line, event)
+assert abs(sel.target.index - .5) < 1e-2
+assert mplcursors.get_ann_text(*sel).startswith("x=")
+"""])
+
+
 @pytest.mark.parametrize(
     "example",
     [path for path in Path("examples").glob("*.py")